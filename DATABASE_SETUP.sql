@@ -8,11 +8,17 @@ CREATE TABLE IF NOT EXISTS dna_profiles (
     id BIGINT PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
     guid UUID NOT NULL UNIQUE DEFAULT gen_random_uuid(),
     user_snps JSONB NOT NULL,
+    tracked_snps JSONB,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
     accessed_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
     created_by TEXT
 );
 
+-- Existing deployments: add the hot tracked-SNP column
+-- (small subset of health-related rsids, read without touching the
+-- full compressed genome payload)
+ALTER TABLE dna_profiles ADD COLUMN IF NOT EXISTS tracked_snps JSONB;
+
 -- Create indexes for faster queries
 CREATE INDEX IF NOT EXISTS idx_dna_profiles_guid ON dna_profiles(guid);
 CREATE INDEX IF NOT EXISTS idx_dna_profiles_created_at ON dna_profiles(created_at);
@@ -4,12 +4,12 @@ Main DNA health analysis tool.
 Parses DNA file, finds health-related variants, and provides AI-powered insights.
 """
 
+import heapq
 import sys
 from pathlib import Path
-from dna_parser import DNAParser
+from dna_service import load_shared
 from health_snps import get_health_snps_list, get_health_snp
-from variant_annotator import VariantAnnotator
-from llm_interpreter import DNAInterpreter, MEDICAL_DISCLAIMER
+from llm_interpreter import MEDICAL_DISCLAIMER
 
 
 def main():
@@ -27,20 +27,11 @@ def main():
         print(f"Error: File not found: {dna_file}")
         sys.exit(1)
 
-    # Step 2: Parse DNA file
+    # Steps 2-3: Parse DNA and find health variants (cached after first run)
     print(f"\nParsing DNA file...")
-    parser = DNAParser(dna_file)
-    snps = parser.parse()
-
-    # Create lookup dict for quick access
-    user_snps = {snp.rsid: snp.genotype for snp in snps}
+    user_snps, health_variants = load_shared(dna_file)
     print(f"Successfully loaded {len(user_snps)} SNPs from your DNA file\n")
 
-    # Step 3: Find health-related variants
-    print("Analyzing health-related variants...")
-    annotator = VariantAnnotator()
-    health_variants = annotator.get_user_health_variants(user_snps)
-
     if not health_variants:
         print("No tracked health variants found in your DNA data.")
         sys.exit(0)
@@ -52,7 +43,8 @@ def main():
     print("YOUR HEALTH VARIANT SUMMARY")
     print("="*70)
 
-    for rsid, variant in sorted(health_variants.items())[:10]:  # Show first 10
+    # Show first 10 by rsid without sorting the full set
+    for rsid, variant in heapq.nsmallest(10, health_variants.items(), key=lambda kv: kv[0]):
         print(f"\n{rsid} ({variant.get('gene')})")
         print(f"  Trait: {variant.get('trait')}")
         print(f"  Your genotype: {variant.get('genotype')}")
@@ -67,12 +59,15 @@ def main():
     print("Type 'quit' to exit.\n")
 
     # Step 5: Interactive conversation with LLM
+    # Deferred import: the Anthropic SDK costs hundreds of ms to load
+    from llm_interpreter import DNAInterpreter
     interpreter = DNAInterpreter()
 
-    # Start with health profile synthesis
+    # Start with health profile synthesis (streamed as it generates)
     print("Generating comprehensive health profile...\n")
-    profile = interpreter.interpret_health_profile(health_variants)
-    print(profile)
+    for chunk in interpreter.stream_health_profile(health_variants):
+        print(chunk, end="", flush=True)
+    print()
 
     # Interactive questions
     print("\n" + "-"*70)
@@ -89,9 +84,10 @@ def main():
         if not question:
             continue
 
-        print(f"\nAnalyzing...")
-        response = interpreter.ask_question(question)
-        print(f"\n{response}\n")
+        print(f"\nAnalyzing...\n")
+        for chunk in interpreter.stream_question(question):
+            print(chunk, end="", flush=True)
+        print("\n")
         print("-"*70)
 
 
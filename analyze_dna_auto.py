@@ -5,17 +5,15 @@ Analyzes your 23andMe DNA file and generates health insights.
 """
 
 import os
+import sys
 from pathlib import Path
-from dna_parser import DNAParser
+from dna_service import load_shared
 from health_snps import get_health_snps_list, get_health_snp
-from variant_annotator import VariantAnnotator
-from llm_interpreter import DNAInterpreter, MEDICAL_DISCLAIMER
+from llm_interpreter import MEDICAL_DISCLAIMER
 
 # Load environment
-from dotenv import load_dotenv
-env_path = Path(__file__).parent / ".env"
-if env_path.exists():
-    load_dotenv(env_path)
+from env_loader import ensure_env
+ensure_env()
 
 
 def main():
@@ -33,20 +31,11 @@ def main():
         print(f"Error: File not found: {dna_file}")
         return
 
-    # Step 1: Parse DNA file
+    # Steps 1-2: Parse DNA and find health variants (cached after first run)
     print(f"Parsing DNA file: {dna_file}")
-    parser = DNAParser(dna_file)
-    snps = parser.parse()
-
-    # Create lookup dict for quick access
-    user_snps = {snp.rsid: snp.genotype for snp in snps}
+    user_snps, health_variants = load_shared(dna_file)
     print(f"Successfully loaded {len(user_snps)} SNPs from your DNA file\n")
 
-    # Step 2: Find health-related variants
-    print("Analyzing health-related variants...")
-    annotator = VariantAnnotator()
-    health_variants = annotator.get_user_health_variants(user_snps)
-
     if not health_variants:
         print("No tracked health variants found in your DNA data.")
         return
@@ -58,18 +47,25 @@ def main():
     print("YOUR HEALTH VARIANT SUMMARY")
     print("="*70 + "\n")
 
-    for rsid, variant in sorted(health_variants.items()):
-        print(f"{rsid:15} | {variant.get('gene'):12} | {variant.get('genotype'):5} | {variant.get('trait')}")
+    # Build the whole table, then emit it in one write instead of one
+    # syscall-per-row print loop
+    sys.stdout.write("".join(
+        f"{rsid:15} | {variant.get('gene'):12} | {variant.get('genotype'):5} | {variant.get('trait')}\n"
+        for rsid, variant in sorted(health_variants.items())
+    ))
 
     # Step 4: Generate comprehensive health profile
     print("\n" + "="*70)
     print("COMPREHENSIVE HEALTH PROFILE")
     print("="*70 + "\n")
 
+    # Deferred import: the Anthropic SDK costs hundreds of ms to load
+    from llm_interpreter import DNAInterpreter
     interpreter = DNAInterpreter()
     print("Generating health profile analysis...\n")
-    profile = interpreter.interpret_health_profile(health_variants)
-    print(profile)
+    for chunk in interpreter.stream_health_profile(health_variants):
+        print(chunk, end="", flush=True)
+    print()
 
     # Step 5: Interactive mode
     print("\n" + "="*70)
@@ -88,9 +84,10 @@ def main():
         if not question:
             continue
 
-        print(f"\nAnalyzing...")
-        response = interpreter.ask_question(question)
-        print(f"\n{response}\n")
+        print(f"\nAnalyzing...\n")
+        for chunk in interpreter.stream_question(question):
+            print(chunk, end="", flush=True)
+        print("\n")
         print("-"*70)
 
 
@@ -0,0 +1,33 @@
+"""
+Shared Anthropic API client.
+
+Every interpreter used to build its own Anthropic() (and with it a fresh
+httpx connection pool), so successive API calls from different objects
+paid a new TCP/TLS handshake. This module hands out one process-wide
+client with a keep-alive pool that all of them reuse.
+"""
+
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1)
+def get_client():
+    """
+    Get the process-wide Anthropic client (created on first use).
+
+    Returns:
+        Shared Anthropic client backed by one keep-alive httpx pool
+    """
+    # Deferred imports: the SDK costs hundreds of ms to load and callers
+    # may never reach an API call
+    from env_loader import ensure_env
+    ensure_env()
+
+    from anthropic import Anthropic
+    import httpx
+
+    try:
+        return Anthropic(http_client=httpx.Client(timeout=60))
+    except (TypeError, AttributeError):
+        # Fallback if the http_client parameter doesn't work
+        return Anthropic()
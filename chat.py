@@ -4,17 +4,16 @@ Interactive DNA chat interface.
 Ask questions about your genetic variants in a conversational format.
 """
 
+import heapq
 import os
+import sys
 from pathlib import Path
-from dna_parser import DNAParser
-from variant_annotator import VariantAnnotator
-from llm_interpreter import DNAInterpreter, MEDICAL_DISCLAIMER
+from dna_service import load_shared
+from llm_interpreter import MEDICAL_DISCLAIMER
 
 # Load environment
-from dotenv import load_dotenv
-env_path = Path(__file__).parent / ".env"
-if env_path.exists():
-    load_dotenv(env_path)
+from env_loader import ensure_env
+ensure_env()
 
 
 def print_header():
@@ -33,21 +32,15 @@ def initialize_dna():
 
     if not Path(dna_file).exists():
         print(f"\n❌ Error: DNA file not found: {dna_file}")
-        return None, None, None
+        return None, None
 
-    # Parse DNA
-    parser = DNAParser(dna_file)
-    snps = parser.parse()
-    user_snps = {snp.rsid: snp.genotype for snp in snps}
-
-    # Find health variants
-    annotator = VariantAnnotator()
-    health_variants = annotator.get_user_health_variants(user_snps)
+    # Parse DNA and find health variants (daemon or disk cache after first run)
+    user_snps, health_variants = load_shared(dna_file)
 
     print(f"✓ Loaded {len(user_snps):,} SNPs")
     print(f"✓ Found {len(health_variants)} health variants\n")
 
-    return user_snps, health_variants, annotator
+    return user_snps, health_variants
 
 
 def print_quick_reference(health_variants):
@@ -55,7 +48,8 @@ def print_quick_reference(health_variants):
     print("="*70)
     print("YOUR HEALTH VARIANTS (Quick Reference)")
     print("="*70)
-    for rsid, variant in sorted(list(health_variants.items())[:10]):
+    # First 10 by rsid (the old slice-then-sort took an arbitrary 10)
+    for rsid, variant in heapq.nsmallest(10, health_variants.items(), key=lambda kv: kv[0]):
         print(f"  {rsid:15} {variant.get('gene'):12} {variant.get('genotype'):5}  {variant.get('trait')}")
     if len(health_variants) > 10:
         print(f"  ... and {len(health_variants) - 10} more variants\n")
@@ -80,6 +74,34 @@ def chat_loop(health_variants, interpreter):
     print("  'quit'      - Exit chat\n")
     print("-"*70 + "\n")
 
+    def _cmd_quit():
+        print("\nThank you for using DNA Health Chat! 🧬")
+        return True
+
+    def _cmd_help():
+        print("\nAvailable commands:")
+        print("  'variants'  - Show all your health variants")
+        print("  'help'      - Show this help message")
+        print("  'quit'      - Exit chat\n")
+
+    def _cmd_variants():
+        print("\nYour Health Variants:")
+        print("-"*70)
+        # One buffered write for the whole table
+        sys.stdout.write("".join(
+            f"  {rsid:15} | {variant.get('gene'):12} | {variant.get('genotype'):5} | {variant.get('trait')}\n"
+            for rsid, variant in sorted(health_variants.items())
+        ))
+        print()
+
+    # Single lowercase + dict dispatch per iteration instead of a chain
+    # of .lower() comparisons
+    commands = {
+        'quit': _cmd_quit,
+        'help': _cmd_help,
+        'variants': _cmd_variants,
+    }
+
     while True:
         try:
             question = input("You: ").strip()
@@ -91,30 +113,19 @@ def chat_loop(health_variants, interpreter):
             continue
 
         # Handle commands
-        if question.lower() == 'quit':
-            print("\nThank you for using DNA Health Chat! 🧬")
-            break
-
-        if question.lower() == 'help':
-            print("\nAvailable commands:")
-            print("  'variants'  - Show all your health variants")
-            print("  'help'      - Show this help message")
-            print("  'quit'      - Exit chat\n")
+        q_lower = question.lower()
+        command = commands.get(q_lower)
+        if command:
+            if command():
+                break
             continue
 
-        if question.lower() == 'variants':
-            print("\nYour Health Variants:")
-            print("-"*70)
-            for rsid, variant in sorted(health_variants.items()):
-                print(f"  {rsid:15} | {variant.get('gene'):12} | {variant.get('genotype'):5} | {variant.get('trait')}")
-            print()
-            continue
-
-        # Ask Claude about DNA
+        # Ask Claude about DNA (streamed as it generates)
         print("\nClaude: ", end="", flush=True)
         try:
-            response = interpreter.ask_question(question)
-            print(response)
+            for chunk in interpreter.stream_question(question):
+                print(chunk, end="", flush=True)
+            print()
         except Exception as e:
             print(f"\n❌ Error: {str(e)}")
             print("Please try again.\n")
@@ -127,7 +138,7 @@ def main():
     print_header()
 
     # Initialize DNA analysis
-    user_snps, health_variants, annotator = initialize_dna()
+    user_snps, health_variants = initialize_dna()
 
     if not health_variants:
         return
@@ -136,6 +147,8 @@ def main():
     print_quick_reference(health_variants)
 
     # Initialize LLM interpreter
+    # Deferred import: the Anthropic SDK costs hundreds of ms to load
+    from llm_interpreter import DNAInterpreter
     interpreter = DNAInterpreter()
 
     # Start chat loop
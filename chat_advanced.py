@@ -4,17 +4,14 @@ Advanced DNA chat - Ask questions about ANY genetic trait or variant.
 """
 
 import os
+import sys
 from pathlib import Path
-from dna_parser import DNAParser
-from variant_annotator import VariantAnnotator
-from universal_interpreter import UniversalDNAInterpreter, SYSTEM_PROMPT
+from dna_service import load_shared
 from llm_interpreter import MEDICAL_DISCLAIMER
 
 # Load environment
-from dotenv import load_dotenv
-env_path = Path(__file__).parent / ".env"
-if env_path.exists():
-    load_dotenv(env_path)
+from env_loader import ensure_env
+ensure_env()
 
 
 def print_header():
@@ -34,14 +31,8 @@ def initialize_dna():
         print(f"\n❌ Error: DNA file not found: {dna_file}")
         return None, None
 
-    # Parse DNA
-    parser = DNAParser(dna_file)
-    snps = parser.parse()
-    user_snps = {snp.rsid: snp.genotype for snp in snps}
-
-    # Find health variants
-    annotator = VariantAnnotator()
-    health_variants = annotator.get_user_health_variants(user_snps)
+    # Parse DNA and find health variants (daemon or disk cache after first run)
+    user_snps, health_variants = load_shared(dna_file)
 
     print(f"✓ Loaded {len(user_snps):,} SNPs from your genome")
     print(f"✓ Found {len(health_variants)} tracked health variants\n")
@@ -92,8 +83,12 @@ COMMANDS:
 
 def chat_loop(user_snps, health_variants):
     """Run advanced interactive chat loop."""
+    # Deferred import: the Anthropic SDK costs hundreds of ms to load
+    from universal_interpreter import UniversalDNAInterpreter
     interpreter = UniversalDNAInterpreter()
     interpreter.set_user_snps(user_snps)
+    # Built once per session so the prompt-cache prefix stays stable
+    interpreter.set_health_variants(health_variants)
 
     print("="*70)
     print("💬 ASK ANYTHING ABOUT GENETICS & YOUR DNA")
@@ -101,6 +96,57 @@ def chat_loop(user_snps, health_variants):
     print("Type 'help' for examples and commands\n")
     print("-"*70 + "\n")
 
+    def _cmd_quit():
+        print("\nThank you for using Advanced DNA Chat! 🧬")
+        return True
+
+    def _cmd_variants():
+        print("\n📋 Your Health Variants:")
+        print("-"*70)
+        # One buffered write for the whole table
+        sys.stdout.write("".join(
+            f"  {rsid:15} | {variant.get('gene'):12} | {variant.get('genotype'):5} | {variant.get('trait')}\n"
+            for rsid, variant in sorted(health_variants.items())
+        ))
+        print()
+
+    def _cmd_reset():
+        interpreter.reset_conversation()
+        print("\n✓ Conversation reset. Starting fresh.\n")
+
+    def _cmd_lookup(arg):
+        rsid = arg.strip().upper()
+        if not rsid.startswith('RS'):
+            rsid = 'rs' + rsid
+        print(f"\n📚 Looking up {rsid}...\n")
+        try:
+            response = interpreter.lookup_variant(rsid)
+            print(f"Claude: {response}\n")
+        except Exception as e:
+            print(f"❌ Error: {str(e)}\n")
+
+    def _cmd_trait(arg):
+        trait = arg.strip()
+        print(f"\n🧬 Researching genetic basis of {trait}...\n")
+        try:
+            response = interpreter.lookup_trait(trait)
+            print(f"Claude: {response}\n")
+        except Exception as e:
+            print(f"❌ Error: {str(e)}\n")
+
+    # Single lowercase + dict dispatch per iteration instead of a chain
+    # of .lower() comparisons
+    commands = {
+        'quit': _cmd_quit,
+        'help': print_help,
+        'variants': _cmd_variants,
+        'reset': _cmd_reset,
+    }
+    prefix_commands = {
+        'lookup': _cmd_lookup,
+        'trait': _cmd_trait,
+    }
+
     while True:
         try:
             question = input("You: ").strip()
@@ -112,49 +158,20 @@ def chat_loop(user_snps, health_variants):
             continue
 
         # Handle commands
-        if question.lower() == 'quit':
-            print("\nThank you for using Advanced DNA Chat! 🧬")
-            break
-
-        if question.lower() == 'help':
-            print_help()
+        q_lower = question.lower()
+        command = commands.get(q_lower)
+        if command:
+            if command():
+                break
             continue
 
-        if question.lower() == 'variants':
-            print("\n📋 Your Health Variants:")
-            print("-"*70)
-            for rsid, variant in sorted(health_variants.items()):
-                print(f"  {rsid:15} | {variant.get('gene'):12} | {variant.get('genotype'):5} | {variant.get('trait')}")
-            print()
-            continue
-
-        if question.lower() == 'reset':
-            interpreter.reset_conversation()
-            print("\n✓ Conversation reset. Starting fresh.\n")
-            continue
-
-        # Handle lookup commands
-        if question.lower().startswith('lookup '):
-            rsid = question.replace('lookup ', '').strip().upper()
-            if not rsid.startswith('RS'):
-                rsid = 'rs' + rsid if not rsid.startswith('rs') else rsid
-            print(f"\n📚 Looking up {rsid}...\n")
-            try:
-                response = interpreter.lookup_variant(rsid)
-                print(f"Claude: {response}\n")
-            except Exception as e:
-                print(f"❌ Error: {str(e)}\n")
-            continue
-
-        if question.lower().startswith('trait '):
-            trait = question.replace('trait ', '').strip()
-            print(f"\n🧬 Researching genetic basis of {trait}...\n")
-            try:
-                response = interpreter.lookup_trait(trait)
-                print(f"Claude: {response}\n")
-            except Exception as e:
-                print(f"❌ Error: {str(e)}\n")
-            continue
+        # Handle 'lookup <rsid>' / 'trait <name>' prefixed commands
+        parts = question.split(maxsplit=1)
+        if len(parts) == 2:
+            prefix_command = prefix_commands.get(parts[0].lower())
+            if prefix_command:
+                prefix_command(parts[1])
+                continue
 
         # Regular question
         print("\nClaude: ", end="", flush=True)
@@ -7,23 +7,32 @@ ClinVar: https://www.ncbi.nlm.nih.gov/clinvar/
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import pickle
+import sqlite3
+import threading
 import time
 import json
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Optional, List
 from dataclasses import dataclass
 from pathlib import Path
-from dotenv import load_dotenv
+from env_loader import ensure_env
 import os
 
 # Load environment
-env_path = Path(__file__).parent / ".env"
-if env_path.exists():
-    load_dotenv(env_path)
+ensure_env()
 
 # NCBI API rate limits: 3 requests/sec without key, 10/sec with key
 NCBI_API_KEY = os.getenv("NCBI_API_KEY", "")
 RATE_LIMIT_DELAY = 0.4 if NCBI_API_KEY else 0.35  # Conservative timing
 
+# On-disk cache for variant lookups. ClinVar records are essentially
+# static, so a long TTL is safe and saves two HTTP calls per rsid.
+CACHE_DB = Path.home() / ".cache" / "dna-analysis" / "clinvar.sqlite"
+CACHE_TTL_SECONDS = 30 * 24 * 3600  # 30 days
+
 
 @dataclass
 class ClinVarVariant:
@@ -47,14 +56,90 @@ class ClinVarAPI:
         self.api_key = api_key
         self.base_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
         self.clinvar_base = "https://www.ncbi.nlm.nih.gov/clinvar"
-        self.last_request_time = 0
+
+        # Threadsafe request scheduler: each caller claims the next free
+        # request slot, so concurrent fetches still respect the API budget
+        self._request_lock = threading.Lock()
+        self._next_request_time = 0.0
+        self._db_lock = threading.Lock()
+
+        # Shared session: keep-alive avoids a fresh TCP+TLS handshake per
+        # query, and retries cover transient NCBI errors
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+            ),
+        ))
+        self.session.headers.update({
+            "User-Agent": "dna-analysis/1.0",
+            "Accept": "application/json",
+        })
+
+        try:
+            CACHE_DB.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(CACHE_DB, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS clinvar ("
+                "  rsid TEXT PRIMARY KEY,"
+                "  payload BLOB,"
+                "  fetched_at REAL"
+                ")"
+            )
+            self._db.commit()
+        except (sqlite3.Error, OSError) as e:
+            print(f"Warning: ClinVar cache unavailable: {str(e)}")
+            self._db = None
+
+    def _cache_get(self, rsid: str):
+        """
+        Look up a cached variant that is still within the TTL.
+
+        Returns:
+            Tuple of (hit, variant). A cached "not found in ClinVar"
+            result is a hit with variant None.
+        """
+        if self._db is None:
+            return False, None
+        with self._db_lock:
+            row = self._db.execute(
+                "SELECT payload FROM clinvar WHERE rsid=? AND fetched_at > ?",
+                (rsid, time.time() - CACHE_TTL_SECONDS)
+            ).fetchone()
+        if row:
+            try:
+                return True, pickle.loads(row[0])
+            except (pickle.UnpicklingError, EOFError):
+                pass
+        return False, None
+
+    def _cache_put(self, rsid: str, variant: Optional["ClinVarVariant"]) -> None:
+        """Store a fetched variant (or a miss) in the on-disk cache."""
+        if self._db is None:
+            return
+        try:
+            with self._db_lock:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO clinvar (rsid, payload, fetched_at) "
+                    "VALUES (?, ?, ?)",
+                    (rsid, pickle.dumps(variant, protocol=5), time.time())
+                )
+                self._db.commit()
+        except sqlite3.Error as e:
+            print(f"Warning: could not write ClinVar cache: {str(e)}")
 
     def _rate_limit(self):
-        """Respect NCBI API rate limits."""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < RATE_LIMIT_DELAY:
-            time.sleep(RATE_LIMIT_DELAY - elapsed)
-        self.last_request_time = time.time()
+        """Respect NCBI API rate limits (safe to call from many threads)."""
+        with self._request_lock:
+            now = time.monotonic()
+            slot = max(now, self._next_request_time)
+            self._next_request_time = slot + RATE_LIMIT_DELAY
+        if slot > now:
+            time.sleep(slot - now)
 
     def _query_ncbi(self, db: str, term: str, retmax: int = 1) -> Dict:
         """Query NCBI E-utilities API."""
@@ -70,13 +155,50 @@ class ClinVarAPI:
             params["api_key"] = self.api_key
 
         try:
-            response = requests.get(f"{self.base_url}/esearch.fcgi", params=params, timeout=10)
+            response = self.session.get(f"{self.base_url}/esearch.fcgi", params=params, timeout=10)
             response.raise_for_status()
             return response.json()
         except Exception as e:
             print(f"Error querying NCBI: {str(e)}")
             return {}
 
+    def _get_clinvar_summaries(self, clinvar_ids: List[str]) -> Dict:
+        """
+        Fetch ESummary records for many ClinVar IDs in one request.
+
+        NCBI accepts comma-separated id lists (up to ~500 records), so a
+        whole gene's worth of variants costs a single rate-limited call
+        instead of one per ID.
+
+        Args:
+            clinvar_ids: List of ClinVar record IDs
+
+        Returns:
+            The ESummary "result" dict keyed by uid (empty on error)
+        """
+        if not clinvar_ids:
+            return {}
+
+        self._rate_limit()
+
+        data = {
+            "db": "clinvar",
+            "id": ",".join(clinvar_ids),
+            "retmode": "json",
+        }
+        if self.api_key:
+            data["api_key"] = self.api_key
+
+        try:
+            response = self.session.post(
+                f"{self.base_url}/esummary.fcgi", data=data, timeout=30
+            )
+            response.raise_for_status()
+            return response.json().get("result", {})
+        except Exception as e:
+            print(f"Error fetching ClinVar summaries: {str(e)}")
+            return {}
+
     def _get_clinvar_details(self, clinvar_id: str) -> Dict:
         """Fetch detailed ClinVar record by ID."""
         self._rate_limit()
@@ -84,7 +206,7 @@ class ClinVarAPI:
         # Try using ClinVar REST API directly (more reliable)
         try:
             url = f"https://www.ncbi.nlm.nih.gov/clinvar/variation/{clinvar_id}/"
-            response = requests.get(url, timeout=10)
+            response = self.session.get(url, timeout=10)
             response.raise_for_status()
 
             # For now, return a simplified response
@@ -108,10 +230,16 @@ class ClinVarAPI:
         Returns:
             ClinVarVariant object if found, None otherwise
         """
+        # Serve from the on-disk cache when possible
+        hit, cached = self._cache_get(rsid)
+        if hit:
+            return cached
+
         # Search for the variant
         search_result = self._query_ncbi("clinvar", f"{rsid}[RSID]", retmax=1)
 
         if not search_result.get("esearchresult", {}).get("idlist"):
+            self._cache_put(rsid, None)
             return None
 
         clinvar_id = search_result["esearchresult"]["idlist"][0]
@@ -123,11 +251,13 @@ class ClinVarAPI:
             # Parse the detailed ClinVar record
             records = details.get("result", {}).get("clinvarset", [])
             if not records:
+                self._cache_put(rsid, None)
                 return None
 
             record = records[0]
             rcv_list = record.get("referenceclinvarAssertion", [])
             if not rcv_list:
+                self._cache_put(rsid, None)
                 return None
 
             rcv = rcv_list[0]
@@ -163,7 +293,7 @@ class ClinVarAPI:
                     pubmed_ids.append(citation.get("id", {}).get("value"))
 
             # Build variant object
-            return ClinVarVariant(
+            variant = ClinVarVariant(
                 rsid=rsid,
                 gene=gene,
                 clinical_significance=significance,
@@ -175,11 +305,35 @@ class ClinVarAPI:
                 inheritance=None,  # Would need to parse from condition details
                 url=f"{self.clinvar_base}/?term={rsid}[RSID]"
             )
+            self._cache_put(rsid, variant)
+            return variant
 
         except Exception as e:
             print(f"Error parsing ClinVar data: {str(e)}")
             return None
 
+    def get_variants(self, rsids: List[str]) -> Dict[str, Optional[ClinVarVariant]]:
+        """
+        Fetch many variants concurrently with a bounded thread pool.
+
+        The work is network-bound, so threads hit the API rate ceiling
+        (10/s with a key, 3/s without) instead of the serial sleep floor.
+
+        Args:
+            rsids: List of variant rsIDs
+
+        Returns:
+            Dict mapping rsid -> ClinVarVariant (or None if not found)
+        """
+        if not rsids:
+            return {}
+
+        max_workers = min(len(rsids), 10 if self.api_key else 3)
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            results = pool.map(self.get_variant, rsids)
+
+        return dict(zip(rsids, results))
+
     def get_variants_by_gene(self, gene: str, significance: str = "Pathogenic") -> List[ClinVarVariant]:
         """
         Query all pathogenic variants for a gene.
@@ -200,10 +354,37 @@ class ClinVarAPI:
         variants = []
         ids = search_result.get("esearchresult", {}).get("idlist", [])
 
-        for clinvar_id in ids[:50]:  # Limit to 50 to avoid too many API calls
-            details = self._get_clinvar_details(clinvar_id)
-            # Parse and add to list (similar to get_variant)
-            # ... parsing code ...
+        # One batched ESummary call for all IDs instead of one per record
+        summaries = self._get_clinvar_summaries(ids[:50])
+
+        for clinvar_id in summaries.get("uids", []):
+            record = summaries.get(clinvar_id, {})
+            if not record:
+                continue
+
+            classification = (
+                record.get("germline_classification")
+                or record.get("clinical_significance")
+                or {}
+            )
+
+            condition = "Unknown"
+            traits = record.get("trait_set", [])
+            if traits:
+                condition = traits[0].get("trait_name", "Unknown")
+
+            variants.append(ClinVarVariant(
+                rsid=record.get("title", clinvar_id),
+                gene=gene,
+                clinical_significance=classification.get("description", "Unknown"),
+                condition=condition,
+                evidence_level=classification.get("review_status", "no assertion provided"),
+                acmg_classification=None,
+                pubmed_ids=[],
+                allele_frequency=None,
+                inheritance=None,
+                url=f"{self.clinvar_base}/variation/{clinvar_id}/"
+            ))
 
         return variants
 
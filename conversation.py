@@ -0,0 +1,71 @@
+"""
+Bounded conversation history for the chat interpreters.
+Keeps per-turn input-token cost O(1) in long sessions by trimming the
+history to a sliding window and folding dropped turns into a short
+rolling summary.
+"""
+
+from typing import Dict, List, Tuple
+
+# Keep the last 6 user/assistant exchanges verbatim
+MAX_HISTORY_MESSAGES = 12
+SUMMARY_MAX_TOKENS = 200
+SUMMARY_MODEL = "claude-haiku-4-5-20251001"
+
+
+def trim_history(client, history: List[Dict], rolling_summary: str) -> Tuple[List[Dict], str]:
+    """
+    Trim history to the sliding window, summarizing dropped turns.
+
+    Args:
+        client: Anthropic client used for the cheap summary call
+        history: Full conversation history (user/assistant dicts)
+        rolling_summary: Summary of turns dropped in earlier trims
+
+    Returns:
+        Tuple of (trimmed history, updated rolling summary)
+    """
+    if len(history) <= MAX_HISTORY_MESSAGES:
+        return history, rolling_summary
+
+    dropped = history[:-MAX_HISTORY_MESSAGES]
+    kept = history[-MAX_HISTORY_MESSAGES:]
+
+    # Keep the window aligned on a user message so roles still alternate
+    while kept and kept[0]["role"] != "user":
+        dropped.append(kept.pop(0))
+
+    transcript = "\n\n".join(f"{m['role']}: {m['content']}" for m in dropped)
+    prompt = (
+        "Condense this genetics-chat transcript into a summary of at most "
+        "200 tokens, keeping the user's variants, questions, and any "
+        "conclusions. Merge with the prior summary if one is given.\n\n"
+        f"Prior summary: {rolling_summary or '(none)'}\n\n"
+        f"Transcript:\n{transcript}"
+    )
+
+    try:
+        response = client.messages.create(
+            model=SUMMARY_MODEL,
+            max_tokens=SUMMARY_MAX_TOKENS,
+            messages=[{"role": "user", "content": prompt}]
+        )
+        rolling_summary = response.content[0].text
+    except Exception:
+        # Summarization is best-effort; worst case we just drop the turns
+        pass
+
+    return kept, rolling_summary
+
+
+def with_summary(history: List[Dict], rolling_summary: str) -> List[Dict]:
+    """Prepend the rolling summary (if any) to a message list for the API."""
+    if not rolling_summary:
+        return history
+
+    return [
+        {"role": "user",
+         "content": f"[Summary of the earlier conversation: {rolling_summary}]"},
+        {"role": "assistant",
+         "content": "Understood. I'll keep that earlier context in mind."},
+    ] + history
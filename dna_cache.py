@@ -0,0 +1,167 @@
+"""
+Disk cache for parsed DNA data.
+Avoids re-parsing the same 23andMe/Ancestry file on every CLI run by
+caching the rsid -> genotype dict, keyed on file path, mtime, and size.
+"""
+
+import hashlib
+import json
+import pickle
+from pathlib import Path
+from typing import Dict, Tuple
+
+from dna_parser import DNAParser
+from health_snps import HEALTH_SNPS
+
+# Optional: arv is a Cython/C++ 23andMe parser (~30x faster than the
+# pure-Python DNAParser). Used automatically when installed.
+try:
+    import arv
+    ARV_AVAILABLE = True
+except ImportError:
+    ARV_AVAILABLE = False
+
+CACHE_DIR = Path.home() / ".cache" / "dna-analysis"
+
+# Version tag for the health SNP table; cached health_variants are
+# invalidated automatically whenever health_snps.py changes.
+HEALTH_SNPS_VERSION = hashlib.blake2b(
+    json.dumps(HEALTH_SNPS, sort_keys=True).encode()
+).hexdigest()[:8]
+
+
+def _cache_key(filepath: Path) -> str:
+    """Build a cache key from the file's path, mtime, and size."""
+    stat = filepath.stat()
+    raw = f"{filepath.resolve()}|{stat.st_mtime_ns}|{stat.st_size}".encode()
+    return hashlib.blake2b(raw).hexdigest()[:16]
+
+
+def _parse_user_snps(filepath: Path) -> Dict[str, str]:
+    """
+    Parse a raw DNA file into an rsid -> genotype dict.
+
+    Uses the arv C++ parser when available (mmap-based, ~70 ms for a
+    24 MB 23andMe file), falling back to the pure-Python DNAParser.
+    """
+    if ARV_AVAILABLE:
+        try:
+            genome = arv.load(str(filepath))
+            user_snps = {rsid: str(genotype) for rsid, genotype in genome.items()}
+            print(f"✓ Parsed {len(user_snps):,} SNPs with arv from {filepath.name}")
+            return user_snps
+        except Exception as e:
+            # Fall back to the text parser on any arv failure (e.g.
+            # Ancestry-format files arv doesn't understand)
+            print(f"Warning: arv parse failed ({str(e)}), using text parser")
+
+    # parse_genotypes skips SNP object construction and, with pandas
+    # installed, tokenizes the whole file in C before one bulk dict build
+    return DNAParser(str(filepath)).parse_genotypes()
+
+
+def load_user_snps(dna_file: str) -> Dict[str, str]:
+    """
+    Load the rsid -> genotype dict for a DNA file, using a disk cache.
+
+    On a cache hit the dict is unpickled directly (tens of ms) instead of
+    re-parsing the ~600k-900k line text file (seconds). The cache entry is
+    invalidated automatically when the source file changes.
+
+    Args:
+        dna_file: Path to a 23andMe/Ancestry raw DNA file
+
+    Returns:
+        Dictionary of rsid -> genotype
+    """
+    filepath = Path(dna_file)
+    if not filepath.exists():
+        raise FileNotFoundError(f"DNA file not found: {filepath}")
+
+    cache_file = CACHE_DIR / f"{_cache_key(filepath)}.pkl"
+
+    # Warm run: load the pre-parsed dict straight from disk
+    if cache_file.exists():
+        try:
+            with open(cache_file, 'rb') as f:
+                user_snps = pickle.load(f)
+            print(f"✓ Loaded {len(user_snps):,} SNPs from cache")
+            return user_snps
+        except (pickle.UnpicklingError, EOFError, OSError):
+            # Corrupt cache entry - fall through and re-parse
+            pass
+
+    # Cold run: parse the file, then cache the result
+    user_snps = _parse_user_snps(filepath)
+
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(cache_file, 'wb') as f:
+            pickle.dump(user_snps, f, protocol=5)
+    except OSError as e:
+        print(f"Warning: could not write DNA cache: {str(e)}")
+
+    return user_snps
+
+
+def load_or_build(dna_file: str) -> Tuple[Dict[str, str], Dict]:
+    """
+    Load user_snps and health_variants for a DNA file, using a disk cache.
+
+    Warm runs skip both the file parse and the annotator pass. The cache
+    entry is keyed on the DNA file (path, mtime, size) plus a version hash
+    of the health SNP table, so edits to either invalidate it.
+
+    Args:
+        dna_file: Path to a 23andMe/Ancestry raw DNA file
+
+    Returns:
+        Tuple of (user_snps dict, health_variants dict)
+    """
+    filepath = Path(dna_file)
+    if not filepath.exists():
+        raise FileNotFoundError(f"DNA file not found: {filepath}")
+
+    cache_file = CACHE_DIR / f"{_cache_key(filepath)}_{HEALTH_SNPS_VERSION}.pkl"
+
+    # Warm run: both dicts come straight off disk
+    if cache_file.exists():
+        try:
+            with open(cache_file, 'rb') as f:
+                cached = pickle.load(f)
+            user_snps = cached["user_snps"]
+            health_variants = cached["health_variants"]
+            print(f"✓ Loaded {len(user_snps):,} SNPs and "
+                  f"{len(health_variants)} health variants from cache")
+            return user_snps, health_variants
+        except (pickle.UnpicklingError, EOFError, OSError, KeyError):
+            # Corrupt or stale cache entry - fall through and rebuild
+            pass
+
+    # Cold run: parse, annotate, then cache both results together
+    user_snps = load_user_snps(str(filepath))
+
+    from variant_annotator import VariantAnnotator
+    annotator = VariantAnnotator()
+    health_variants = annotator.get_user_health_variants(user_snps)
+
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(cache_file, 'wb') as f:
+            pickle.dump(
+                {"user_snps": user_snps, "health_variants": health_variants},
+                f, protocol=5
+            )
+    except OSError as e:
+        print(f"Warning: could not write DNA cache: {str(e)}")
+
+    return user_snps, health_variants
+
+
+if __name__ == "__main__":
+    # Test the cache
+    test_file = Path(__file__).parent / "source" / "genome_Sean_O_Reilly_v3_Full_20170428141907.txt"
+
+    user_snps = load_user_snps(str(test_file))
+    print(f"\nLoaded {len(user_snps):,} SNPs")
+    print("Run again to load from cache.")
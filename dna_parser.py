@@ -8,8 +8,17 @@ from pathlib import Path
 from dataclasses import dataclass
 from typing import List, Dict, Optional
 
+# Optional C-speed tokenizer for the filtered streaming path. pandas
+# parses the tab-separated file in C and only the matching rows ever
+# become Python objects.
+try:
+    import pandas as pd
+    PANDAS_AVAILABLE = True
+except ImportError:
+    PANDAS_AVAILABLE = False
 
-@dataclass
+
+@dataclass(slots=True)
 class SNP:
     """Represents a single nucleotide polymorphism."""
     rsid: str
@@ -29,6 +38,7 @@ class DNAParser:
         self.filepath = Path(filepath)
         self.snps: List[SNP] = []
         self.metadata: Dict[str, str] = {}
+        self.data_row_count = 0
 
     def parse(self) -> List[SNP]:
         """
@@ -46,6 +56,179 @@ class DNAParser:
 
         return self.snps
 
+    def iter_snps(self, keep: Optional[set] = None):
+        """
+        Stream SNPs from the file without materializing the full list.
+
+        When `keep` is given, non-matching rows are rejected on a cheap
+        rsid prefix check before any tokenization, so only the rows of
+        interest pay for splitting and SNP construction. The number of
+        data rows scanned is recorded in self.data_row_count.
+
+        Args:
+            keep: Optional set of rsIDs to yield; None yields everything.
+
+        Yields:
+            SNP objects in file order.
+        """
+        if not self.filepath.exists():
+            raise FileNotFoundError(f"DNA file not found: {self.filepath}")
+
+        if PANDAS_AVAILABLE and keep is not None:
+            yield from self._iter_snps_pandas(keep)
+            return
+
+        self.data_row_count = 0
+        with open(self.filepath, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.startswith('#') or line.startswith('rsid'):
+                    continue
+                if not line.strip():
+                    continue
+                self.data_row_count += 1
+
+                # Cheap prefilter: rsid is everything before the first tab
+                if keep is not None and line[:line.find('\t')] not in keep:
+                    continue
+
+                try:
+                    parts = line.strip().split('\t')
+                    if len(parts) < 4:
+                        continue
+
+                    rsid, chromosome, position, genotype = parts[0], parts[1], parts[2], parts[3]
+
+                    if chromosome in ('MT', 'Unknown', 'PAR'):
+                        continue
+
+                    try:
+                        position = int(position)
+                    except (ValueError, TypeError):
+                        continue
+
+                    if not genotype or genotype == '--':
+                        continue
+
+                    yield SNP(
+                        rsid=rsid,
+                        chromosome=chromosome,
+                        position=position,
+                        genotype=genotype
+                    )
+                except (ValueError, IndexError, AttributeError):
+                    continue
+
+    def parse_genotypes(self) -> Dict[str, str]:
+        """
+        Parse the file straight into an rsid -> genotype dict.
+
+        Skips SNP object construction entirely: callers that only need
+        genotypes (the CLI agents, the disk cache) avoid ~900K dataclass
+        allocations. With pandas installed the whole file is tokenized in
+        C (pyarrow engine when available) and the dict is built in one
+        bulk zip instead of a Python-level loop per line.
+
+        Returns:
+            Dictionary of rsid -> genotype with the same row filtering
+            as parse() (drops MT/Unknown/PAR, bad positions, '--').
+        """
+        if not self.filepath.exists():
+            raise FileNotFoundError(f"DNA file not found: {self.filepath}")
+
+        if PANDAS_AVAILABLE:
+            try:
+                return self._parse_genotypes_pandas()
+            except Exception as e:
+                print(f"Warning: pandas parse failed ({str(e)}), using text parser")
+
+        genotypes: Dict[str, str] = {}
+        self.data_row_count = 0
+        with open(self.filepath, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.startswith('#') or line.startswith('rsid'):
+                    continue
+                if not line.strip():
+                    continue
+                self.data_row_count += 1
+
+                parts = line.strip().split('\t')
+                if len(parts) < 4:
+                    continue
+                rsid, chromosome, position, genotype = parts[0], parts[1], parts[2], parts[3]
+                if chromosome in ('MT', 'Unknown', 'PAR'):
+                    continue
+                if not position.isdigit():
+                    continue
+                if not genotype or genotype == '--':
+                    continue
+                genotypes[rsid] = genotype
+
+        return genotypes
+
+    def _parse_genotypes_pandas(self) -> Dict[str, str]:
+        """Bulk C-parser path for parse_genotypes."""
+        read_kwargs = dict(
+            sep='\t',
+            comment='#',
+            header=None,
+            names=['rsid', 'chromosome', 'position', 'genotype'],
+            dtype=str,
+            usecols=[0, 1, 2, 3],
+            on_bad_lines='skip',
+        )
+        try:
+            df = pd.read_csv(self.filepath, engine='pyarrow', **read_kwargs)
+        except (ValueError, ImportError):
+            # pyarrow not installed or engine rejects an option
+            df = pd.read_csv(self.filepath, **read_kwargs)
+
+        # Drop the column-name row if present; then apply the same row
+        # filters as parse(), vectorized over the whole frame at once
+        self.data_row_count = len(df)
+        mask = (
+            ~df['chromosome'].isin(('MT', 'Unknown', 'PAR'))
+            & df['position'].str.isdigit()
+            & df['genotype'].notna()
+            & df['genotype'].ne('--')
+            & df['rsid'].ne('rsid')
+        )
+        df = df[mask]
+        return dict(zip(df['rsid'], df['genotype']))
+
+    def _iter_snps_pandas(self, keep: set):
+        """
+        C-parser fast path for iter_snps: the non-matching ~939K rows
+        are tokenized and discarded entirely inside pandas.
+        """
+        df = pd.read_csv(
+            self.filepath,
+            sep='\t',
+            comment='#',
+            header=None,
+            names=['rsid', 'chromosome', 'position', 'genotype'],
+            dtype=str,
+            usecols=[0, 1, 2, 3],
+            on_bad_lines='skip',
+        )
+        self.data_row_count = len(df)
+
+        matched = df[df['rsid'].isin(keep)]
+        for row in matched.itertuples(index=False):
+            if row.chromosome in ('MT', 'Unknown', 'PAR'):
+                continue
+            try:
+                position = int(row.position)
+            except (ValueError, TypeError):
+                continue
+            if not row.genotype or row.genotype == '--':
+                continue
+            yield SNP(
+                rsid=row.rsid,
+                chromosome=row.chromosome,
+                position=position,
+                genotype=row.genotype
+            )
+
     def _extract_metadata(self, file_obj) -> None:
         """Extract header metadata from DNA file."""
         file_obj.seek(0)
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Shared DNA analysis service.
+
+Every entry point (analyze_dna, chat, etc.) needs the same parsed genome
+and the same tracked-health-variant dict. This module holds that heavy
+state in one place:
+
+- In-process: DNAService.get(dna_file) is memoized, so repeated requests
+  within a process parse the file at most once (and the disk cache in
+  dna_cache makes the first build cheap on warm runs).
+- Cross-process (optional): `python dna_service.py --serve` keeps a parsed
+  genome resident in a small Unix-socket daemon. Entry points try the
+  socket first via load_shared() and silently fall back to in-process.
+"""
+
+import functools
+import json
+import os
+import socket
+import socketserver
+import sys
+from pathlib import Path
+from typing import Dict, Tuple
+
+# The socket lives in a user-owned directory, never a world-writable
+# one like /tmp where any local user could pre-bind the path and feed
+# entry points a forged payload. XDG_RUNTIME_DIR is per-user and 0700
+# by spec; the cache-dir fallback is created 0700 in serve().
+_RUNTIME_DIR = Path(
+    os.environ.get("XDG_RUNTIME_DIR")
+    or Path.home() / ".cache" / "dna-analysis"
+)
+SOCKET_PATH = str(_RUNTIME_DIR / "dna.sock")
+
+
+class DNAService:
+    """Holds the parsed genome and derived health variants for one file."""
+
+    def __init__(self, dna_file: str):
+        from dna_cache import load_or_build
+        self.dna_file = dna_file
+        self.user_snps, self.health_variants = load_or_build(dna_file)
+
+    @staticmethod
+    def get(dna_file: str) -> "DNAService":
+        """Get the memoized service instance for a DNA file."""
+        return _get_service(dna_file)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_service(dna_file: str) -> DNAService:
+    return DNAService(dna_file)
+
+
+def load_shared(dna_file: str) -> Tuple[Dict[str, str], Dict[str, Dict]]:
+    """
+    Load (user_snps, health_variants), preferring a running daemon.
+
+    If a `--serve` daemon is listening on SOCKET_PATH the parsed data is
+    fetched from it (sub-100 ms, no parsing). Otherwise falls back to the
+    in-process memoized service.
+
+    Args:
+        dna_file: Path to the 23andMe raw data file
+
+    Returns:
+        Tuple of (user_snps dict, health_variants dict)
+    """
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(5.0)
+            sock.connect(SOCKET_PATH)
+            request = {"op": "get_health_variants", "dna_file": dna_file}
+            sock.sendall(json.dumps(request).encode() + b"\n")
+            sock.shutdown(socket.SHUT_WR)
+            chunks = []
+            while True:
+                chunk = sock.recv(1 << 20)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+        # JSON wire format: plain data only, nothing executable - a
+        # forged or corrupt payload can at worst fail to parse and
+        # drop us into the in-process fallback
+        payload = json.loads(b"".join(chunks))
+        return payload["user_snps"], payload["health_variants"]
+    except (OSError, ValueError, KeyError, TypeError):
+        service = DNAService.get(dna_file)
+        return service.user_snps, service.health_variants
+
+
+class _ServiceHandler(socketserver.StreamRequestHandler):
+    """Answers one JSON request per connection with a JSON payload."""
+
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.readline())
+        except (ValueError, UnicodeDecodeError):
+            return
+
+        if request.get("op") == "get_health_variants":
+            service = DNAService.get(request["dna_file"])
+            payload = {
+                "user_snps": service.user_snps,
+                "health_variants": service.health_variants,
+            }
+            self.wfile.write(json.dumps(payload).encode())
+
+
+def serve(dna_file: str = None):
+    """Run the resident daemon on SOCKET_PATH until interrupted."""
+    # Private runtime dir: only this user may reach (or pre-create)
+    # the socket path
+    _RUNTIME_DIR.mkdir(parents=True, exist_ok=True)
+    os.chmod(_RUNTIME_DIR, 0o700)
+
+    if os.path.exists(SOCKET_PATH):
+        os.unlink(SOCKET_PATH)
+
+    if dna_file:
+        # Pre-warm so the first client doesn't pay the parse cost
+        DNAService.get(dna_file)
+
+    with socketserver.UnixStreamServer(SOCKET_PATH, _ServiceHandler) as server:
+        os.chmod(SOCKET_PATH, 0o600)
+        print(f"✓ DNA service listening on {SOCKET_PATH}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            print("\nShutting down DNA service.")
+        finally:
+            if os.path.exists(SOCKET_PATH):
+                os.unlink(SOCKET_PATH)
+
+
+if __name__ == "__main__":
+    if "--serve" in sys.argv:
+        args = [a for a in sys.argv[1:] if a != "--serve"]
+        serve(args[0] if args else None)
+    else:
+        print("Usage: python dna_service.py --serve [dna_file]")
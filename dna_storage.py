@@ -3,24 +3,31 @@ Persistent DNA storage using Supabase
 Allows users to get a shareable GUID-based URL for their DNA data
 """
 
+import base64
 import json
 import uuid
 from datetime import datetime
 from typing import Dict, Optional
 from pathlib import Path
-from dotenv import load_dotenv
+from env_loader import ensure_env
 import os
 
-# Load environment
-env_path = Path(__file__).parent / ".env"
-if env_path.exists():
-    load_dotenv(env_path)
+# Optional fast serialization/compression. orjson is 5-10x faster than
+# stdlib json on the ~900k-entry SNP dict, and zstd shrinks the payload
+# ~8x before it goes over the wire to Supabase.
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 try:
-    from supabase import create_client, Client
-    SUPABASE_AVAILABLE = True
+    import zstandard as zstd
+    ZSTD_AVAILABLE = True
 except ImportError:
-    SUPABASE_AVAILABLE = False
+    ZSTD_AVAILABLE = False
+
+from health_snps import get_health_snps_list
 
 
 class DNAStorage:
@@ -28,7 +35,12 @@ class DNAStorage:
 
     def __init__(self):
         """Initialize Supabase client."""
-        if not SUPABASE_AVAILABLE:
+        ensure_env()
+
+        # Deferred import: the supabase package is heavy and optional
+        try:
+            from supabase import create_client
+        except ImportError:
             self.client = None
             return
 
@@ -44,6 +56,46 @@ class DNAStorage:
         """Check if Supabase is configured."""
         return self.client is not None
 
+    @staticmethod
+    def _serialize_snps(user_snps: Dict[str, str]) -> str:
+        """
+        Serialize the SNP dict for storage.
+
+        Uses orjson when available and wraps the result in a zstd +
+        base64 envelope when zstandard is installed. Falls back to the
+        legacy plain-JSON format otherwise.
+        """
+        if ORJSON_AVAILABLE:
+            raw = orjson.dumps(user_snps)
+        else:
+            raw = json.dumps(user_snps).encode()
+
+        if ZSTD_AVAILABLE:
+            compressed = zstd.ZstdCompressor(level=3).compress(raw)
+            return json.dumps({
+                "compression": "zstd:v1",
+                "payload": base64.b64encode(compressed).decode("ascii"),
+            })
+
+        return raw.decode()
+
+    @staticmethod
+    def _deserialize_snps(stored: str) -> Dict[str, str]:
+        """Decode a stored SNP payload (compressed envelope or legacy JSON)."""
+        if ORJSON_AVAILABLE:
+            data = orjson.loads(stored)
+        else:
+            data = json.loads(stored)
+
+        # Compressed envelope written by _serialize_snps
+        if isinstance(data, dict) and data.get("compression") == "zstd:v1":
+            raw = zstd.ZstdDecompressor().decompress(
+                base64.b64decode(data["payload"])
+            )
+            return orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+
+        return data
+
     def save_dna(self, user_snps: Dict[str, str], health_snps: Dict) -> Optional[str]:
         """
         Save DNA data to Supabase and return GUID.
@@ -62,16 +114,30 @@ class DNAStorage:
             # Generate GUID
             guid = str(uuid.uuid4())
 
+            # Hot subset: the ~20 tracked rsids the app actually reads,
+            # stored uncompressed so the common path is a narrow SELECT
+            tracked = {
+                rsid: user_snps[rsid]
+                for rsid in get_health_snps_list()
+                if rsid in user_snps
+            }
+
             # Prepare data
             dna_data = {
                 "guid": guid,
-                "user_snps": json.dumps(user_snps),
+                "user_snps": self._serialize_snps(user_snps),
+                "tracked_snps": json.dumps(tracked),
                 "created_at": datetime.utcnow().isoformat(),
                 "accessed_at": datetime.utcnow().isoformat(),
             }
 
             # Store in Supabase
-            result = self.client.table("dna_profiles").insert(dna_data).execute()
+            try:
+                result = self.client.table("dna_profiles").insert(dna_data).execute()
+            except Exception:
+                # Older deployments without the tracked_snps column
+                dna_data.pop("tracked_snps")
+                result = self.client.table("dna_profiles").insert(dna_data).execute()
 
             if result.data:
                 return guid
@@ -109,7 +175,7 @@ class DNAStorage:
                 ).eq("guid", guid).execute()
 
                 # Parse and return DNA data
-                user_snps = json.loads(result.data[0]["user_snps"])
+                user_snps = self._deserialize_snps(result.data[0]["user_snps"])
                 return user_snps
 
             return None
@@ -118,6 +184,50 @@ class DNAStorage:
             print(f"Error loading DNA: {str(e)}")
             return None
 
+    def load_tracked_snps(self, guid: str) -> Optional[Dict[str, str]]:
+        """
+        Load only the tracked health SNPs for a profile.
+
+        This is a narrow SELECT on the hot column - no decompression of
+        the full genome payload. Falls back to the full load for rows
+        written before the tracked_snps column existed.
+
+        Args:
+            guid: The GUID to load
+
+        Returns:
+            Dict of {rsid: genotype} for tracked SNPs, None if not found
+        """
+        if not self.is_available():
+            return None
+
+        try:
+            result = (
+                self.client.table("dna_profiles")
+                .select("tracked_snps")
+                .eq("guid", guid)
+                .execute()
+            )
+
+            if result.data and len(result.data) > 0:
+                tracked = result.data[0].get("tracked_snps")
+                if tracked:
+                    return json.loads(tracked) if isinstance(tracked, str) else tracked
+
+            # Legacy row: fall back to the full genome payload
+            user_snps = self.load_dna(guid)
+            if user_snps:
+                return {
+                    rsid: user_snps[rsid]
+                    for rsid in get_health_snps_list()
+                    if rsid in user_snps
+                }
+            return None
+
+        except Exception as e:
+            print(f"Error loading tracked SNPs: {str(e)}")
+            return None
+
     def get_dna_url(self, guid: str, base_url: str = None) -> str:
         """
         Get the URL for accessing DNA by GUID.
@@ -0,0 +1,17 @@
+"""
+Single memoized .env loader.
+Replaces the load_dotenv block duplicated across the entry points, so
+the file is read (and dotenv imported) at most once per process.
+"""
+
+import functools
+from pathlib import Path
+
+
+@functools.lru_cache(maxsize=None)
+def ensure_env() -> None:
+    """Load .env once; subsequent calls are no-ops."""
+    env_path = Path(__file__).parent / ".env"
+    if env_path.exists():
+        from dotenv import load_dotenv
+        load_dotenv(env_path)
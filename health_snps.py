@@ -3,6 +3,8 @@ Curated database of health-related SNPs.
 Focus on well-studied variants with clear health implications.
 """
 
+from types import MappingProxyType
+
 # Health SNP Database
 # Format: rsid -> {gene, trait, genotypes, descriptions}
 HEALTH_SNPS = {
@@ -174,19 +176,112 @@ HEALTH_SNPS = {
 }
 
 
+# Structure-of-arrays view of the database: parallel tuples are laid out
+# contiguously, so scans touch adjacent slots instead of chasing pointers
+# through one inner dict per SNP
+_RSIDS = tuple(HEALTH_SNPS)
+_GENES = tuple(info["gene"] for info in HEALTH_SNPS.values())
+_TRAITS = tuple(info["trait"] for info in HEALTH_SNPS.values())
+_ALLELES = tuple(info["alleles"] for info in HEALTH_SNPS.values())
+_DESCRIPTIONS = tuple(info["description"] for info in HEALTH_SNPS.values())
+_RSID_INDEX = {rsid: i for i, rsid in enumerate(_RSIDS)}
+
+# Frozen display order so prompt builders never re-sort per call
+SORTED_RSIDS = tuple(sorted(HEALTH_SNPS))
+
+
+def _build_allele_table(alleles: dict) -> tuple:
+    """Flatten an allele dict into a 128-slot tuple indexed by ord(char)."""
+    table = [''] * 128
+    for allele, meaning in alleles.items():
+        table[ord(allele)] = meaning
+    return tuple(table)
+
+
+# Per-SNP perfect-hash allele tables: effect lookup is plain tuple
+# indexing on ord(allele), no hashing or equality calls
+_ALLELE_TABLES = tuple(_build_allele_table(a) for a in _ALLELES)
+
+
+# Alleles whose annotation marks them as risk-raising ("risk",
+# "higher risk", "increased ... risk"), built once at import so risk
+# tallies are deterministic and never left to the LLM
+RISK_ALLELES = {
+    rsid: frozenset(
+        allele
+        for allele, meaning in info["alleles"].items()
+        if "risk" in meaning.lower()
+        and not meaning.lower().startswith(("lower", "protective"))
+    )
+    for rsid, info in HEALTH_SNPS.items()
+}
+
+
+def allele_effect(rsid: str, allele: str) -> str:
+    """
+    Get the effect annotation for one allele of a tracked SNP.
+
+    Args:
+        rsid: SNP identifier
+        allele: Single allele character (e.g. "A")
+
+    Returns:
+        Effect string, or '' if the SNP or allele is unknown
+    """
+    i = _RSID_INDEX.get(rsid)
+    if i is None:
+        return ''
+    code = ord(allele)
+    return _ALLELE_TABLES[i][code] if code < 128 else ''
+
+# Read-only view handed to callers instead of fresh copies
+_HEALTH_SNPS_VIEW = MappingProxyType(HEALTH_SNPS)
+
+
 def get_health_snp(rsid: str) -> dict:
     """Get health information for a specific SNP."""
-    return HEALTH_SNPS.get(rsid, None)
+    i = _RSID_INDEX.get(rsid)
+    if i is None:
+        return None
+    return {
+        "gene": _GENES[i],
+        "trait": _TRAITS[i],
+        "alleles": _ALLELES[i],
+        "description": _DESCRIPTIONS[i],
+    }
 
 
 def get_all_health_snps() -> dict:
-    """Get all health SNPs."""
-    return HEALTH_SNPS.copy()
-
-
-def get_health_snps_list() -> list:
-    """Get list of all rsIDs we track."""
-    return list(HEALTH_SNPS.keys())
+    """Get all health SNPs (read-only view)."""
+    return _HEALTH_SNPS_VIEW
+
+
+def get_health_snps_list() -> tuple:
+    """Get all rsIDs we track (shared immutable tuple)."""
+    return _RSIDS
+
+
+def _render_explanation(i: int, rsid: str, genotype: str) -> str:
+    """Format the explanation string for one (rsid, genotype) pair."""
+    return (
+        f"**{rsid} ({_GENES[i]})**\n"
+        f"Trait: {_TRAITS[i]}\n"
+        f"Your genotype: {genotype}\n"
+        f"Interpretation: {_DESCRIPTIONS[i]}"
+    )
+
+
+# Fully specialized explanation table: every realistic genotype (all
+# 2-char combinations over each SNP's allele set) is rendered once at
+# import, so the common path below is two dict probes and no formatting
+_EXPLANATIONS = {
+    rsid: {
+        a + b: _render_explanation(_RSID_INDEX[rsid], rsid, a + b)
+        for a in info["alleles"]
+        for b in info["alleles"]
+    }
+    for rsid, info in HEALTH_SNPS.items()
+}
 
 
 def explain_genotype(rsid: str, genotype: str) -> str:
@@ -200,29 +295,18 @@ def explain_genotype(rsid: str, genotype: str) -> str:
     Returns:
         Human-readable explanation
     """
-    snp_info = get_health_snp(rsid)
-    if not snp_info:
+    table = _EXPLANATIONS.get(rsid)
+    if table is None:
         return None
 
-    alleles = snp_info.get('alleles', {})
-    trait = snp_info.get('trait', '')
-    description = snp_info.get('description', '')
+    hit = table.get(genotype)
+    if hit is not None:
+        return hit
 
+    # Genotype outside the SNP's known allele set - render on demand
     if not genotype or len(genotype) < 2:
         return None
-
-    allele1, allele2 = genotype[0], genotype[1]
-
-    effect1 = alleles.get(allele1, '')
-    effect2 = alleles.get(allele2, '')
-
-    # Build explanation
-    explanation = f"**{rsid} ({snp_info.get('gene', 'Unknown')})**\n"
-    explanation += f"Trait: {trait}\n"
-    explanation += f"Your genotype: {genotype}\n"
-    explanation += f"Interpretation: {description}"
-
-    return explanation
+    return _render_explanation(_RSID_INDEX[rsid], rsid, genotype)
 
 
 if __name__ == "__main__":
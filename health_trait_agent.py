@@ -13,73 +13,42 @@ This agent:
 """
 
 from pathlib import Path
-from dotenv import load_dotenv
-from anthropic import Anthropic
-from dna_parser import DNAParser
-from health_snps import get_all_health_snps
+from typing import Dict, Optional
+from api_client import get_client
+from health_snps import get_all_health_snps, RISK_ALLELES, SORTED_RSIDS
+from conversation import trim_history, with_summary
 
-# Load environment
-env_path = Path(__file__).parent / ".env"
-if env_path.exists():
-    load_dotenv(env_path)
+# Genotypes are stored packed: two 8-bit allele codes in one int rather
+# than a ~50 B two-char str per SNP. Anything outside the known allele
+# alphabet (e.g. odd no-call markers) stays a plain string.
+_ALLELE_CODE = {c: i for i, c in enumerate("ACGTRXSsDI-0")}
+_CODE_ALLELE = {i: c for c, i in _ALLELE_CODE.items()}
 
 
-class HealthTraitAgent:
-    """Intelligent agent that relates your DNA to health traits."""
-
-    def __init__(self):
-        """Initialize the agent with user's DNA."""
-        import httpx
-        # Create client with explicit http client configuration
+def _encode_genotype(genotype: str):
+    """Pack a 2-char genotype into an int, or pass it through unchanged."""
+    if len(genotype) == 2:
         try:
-            self.client = Anthropic(
-                http_client=httpx.Client()
-            )
-        except (TypeError, AttributeError):
-            # Fallback if http_client parameter doesn't work
-            self.client = Anthropic()
-        self.conversation_history = []
-        self.user_snps = {}
-        self.health_snps_db = get_all_health_snps()
-        self.model = "claude-haiku-4-5-20251001"
+            return (_ALLELE_CODE[genotype[0]] << 8) | _ALLELE_CODE[genotype[1]]
+        except KeyError:
+            pass
+    return genotype
 
-    def load_dna(self, dna_file: str) -> bool:
-        """Load user's DNA file."""
-        if not Path(dna_file).exists():
-            print(f"❌ DNA file not found: {dna_file}")
-            return False
 
-        print(f"Loading your DNA from {dna_file}...")
-        parser = DNAParser(dna_file)
-        snps = parser.parse()
-        self.user_snps = {snp.rsid: snp.genotype for snp in snps}
+def _decode_genotype(packed) -> str:
+    """Inverse of _encode_genotype."""
+    if isinstance(packed, str):
+        return packed
+    return _CODE_ALLELE[packed >> 8] + _CODE_ALLELE[packed & 0xFF]
 
-        print(f"✓ Loaded {len(self.user_snps):,} SNPs")
-        print(f"✓ Analyzing {len(self.health_snps_db)} health-related variants\n")
 
-        return True
+# Static halves of the system prompt; only the variants block between
+# them depends on the loaded DNA
+SYSTEM_PROMPT_PREFIX = """You are a health genetics expert who understands this user's specific DNA.
 
-    def _build_system_prompt(self) -> str:
-        """Build system prompt with user's DNA context."""
-        # Get user's health variants
-        user_health_variants = {}
-        for rsid, info in self.health_snps_db.items():
-            if rsid in self.user_snps:
-                user_health_variants[rsid] = {
-                    "genotype": self.user_snps[rsid],
-                    "gene": info.get("gene"),
-                    "trait": info.get("trait"),
-                    "alleles": info.get("alleles"),
-                }
-
-        # Format for prompt
-        variants_text = "USER'S HEALTH VARIANTS:\n"
-        for rsid, data in sorted(user_health_variants.items()):
-            variants_text += f"- {rsid} ({data['gene']}): {data['genotype']} - {data['trait']}\n"
-
-        return f"""You are a health genetics expert who understands this user's specific DNA.
-
-{variants_text}
+"""
+
+SYSTEM_PROMPT_SUFFIX = """
 
 IMPORTANT GUIDELINES:
 1. When the user asks about a health trait, you should:
@@ -114,6 +83,160 @@ When answering about health traits, ALWAYS:
 - Provide science-based, not fear-based, information
 """
 
+
+class HealthTraitAgent:
+    """Intelligent agent that relates your DNA to health traits."""
+
+    __slots__ = (
+        'client',
+        'conversation_history',
+        'rolling_summary',
+        'user_snps',
+        'total_snps',
+        'health_snps_db',
+        '_health_rsids',
+        'model',
+        '_variants_text',
+        '_system_prompt',
+        '_system_block_list',
+    )
+
+    def __init__(self):
+        """Initialize the agent with user's DNA."""
+        # Shared process-wide client; created lazily on first use
+        self.client = get_client()
+        self.conversation_history = []
+        self.rolling_summary = ""
+        self.user_snps = {}
+        self.total_snps = 0
+        self.health_snps_db = get_all_health_snps()
+        self._health_rsids = frozenset(self.health_snps_db)
+        self.model = "claude-haiku-4-5-20251001"
+        self._variants_text = ""
+        self._system_prompt = SYSTEM_PROMPT_PREFIX + SYSTEM_PROMPT_SUFFIX
+        self._system_block_list = self._render_system_blocks()
+
+    def load_dna(self, dna_file: str) -> bool:
+        """Load user's DNA file."""
+        if not Path(dna_file).exists():
+            print(f"❌ DNA file not found: {dna_file}")
+            return False
+
+        print(f"Loading your DNA from {dna_file}...")
+        from dna_parser import DNAParser
+        parser = DNAParser(dna_file)
+
+        # Stream the file keeping only the ~25 tracked rsids: no SNP
+        # objects are built for the other 939K rows, and the agent never
+        # holds a tens-of-MB dict for them
+        self.set_user_snps(
+            {
+                snp.rsid: snp.genotype
+                for snp in parser.iter_snps(keep=self._health_rsids)
+            },
+            total=parser.data_row_count,
+        )
+
+        print(f"✓ Loaded {self.total_snps:,} SNPs")
+        print(f"✓ Analyzing {len(self.health_snps_db)} health-related variants\n")
+
+        return True
+
+    def set_user_snps(self, user_snps: Dict[str, str], total: Optional[int] = None) -> None:
+        """
+        Install a genotype dict (full genome or tracked subset).
+
+        Projects it down to the tracked rsids, packs the genotypes, and
+        re-renders the cached system prompt. Used by load_dna and by
+        callers that already hold a parsed dict (e.g. Supabase restore).
+
+        Args:
+            user_snps: Dict of {rsid: genotype}
+            total: Genome size to report; defaults to len(user_snps)
+        """
+        self.total_snps = total if total is not None else len(user_snps)
+        self.user_snps = {
+            rsid: _encode_genotype(genotype)
+            for rsid, genotype in user_snps.items()
+            if rsid in self._health_rsids
+        }
+
+        # The variants block and full system prompt only change when DNA
+        # is (re)loaded, so render them once here instead of every turn
+        parts = ["USER'S HEALTH VARIANTS:\n"]
+        for rsid in SORTED_RSIDS:
+            # Single probe for existence + value
+            genotype = self.user_snps.get(rsid)
+            if genotype is None:
+                continue
+            info = self.health_snps_db[rsid]
+            parts.append(
+                f"- {rsid} ({info['gene']}): {_decode_genotype(genotype)} - {info['trait']}\n"
+            )
+
+        # Precomputed risk tallies so the model never has to count
+        risk_counts = self.risk_summary()
+        if risk_counts:
+            parts.append("\nPRECOMPUTED RISK ALLELE COUNTS:\n")
+            parts.extend(
+                f"- {rsid}: carries {count} of 2 risk-associated alleles\n"
+                for rsid, count in risk_counts.items()
+            )
+
+        variants_text = "".join(parts)
+        self._variants_text = variants_text
+        self._system_prompt = SYSTEM_PROMPT_PREFIX + variants_text + SYSTEM_PROMPT_SUFFIX
+        self._system_block_list = self._render_system_blocks()
+
+    def genotype_of(self, rsid: str) -> Optional[str]:
+        """Decoded genotype for a tracked rsid, or None if not carried."""
+        packed = self.user_snps.get(rsid)
+        return None if packed is None else _decode_genotype(packed)
+
+    def risk_summary(self) -> dict:
+        """
+        Count risk-associated alleles per tracked SNP, deterministically.
+
+        Returns:
+            Dict of rsid -> number of risk alleles carried (1 or 2);
+            SNPs with no risk alleles are omitted.
+        """
+        summary = {}
+        for rsid in SORTED_RSIDS:
+            packed = self.user_snps.get(rsid)
+            if packed is None:
+                continue
+            risk = RISK_ALLELES.get(rsid)
+            if not risk:
+                continue
+            count = sum(1 for allele in _decode_genotype(packed) if allele in risk)
+            if count:
+                summary[rsid] = count
+        return summary
+
+    def _build_system_prompt(self) -> str:
+        """Return the system prompt rendered when DNA was loaded."""
+        return self._system_prompt
+
+    def _render_system_blocks(self) -> list:
+        """
+        Render the system prompt as blocks with the stable tail marked
+        cacheable: the variants table + guidelines are identical across
+        a session, so the API reuses the processed prefix every turn.
+        """
+        return [
+            {"type": "text", "text": SYSTEM_PROMPT_PREFIX},
+            {
+                "type": "text",
+                "text": self._variants_text + SYSTEM_PROMPT_SUFFIX,
+                "cache_control": {"type": "ephemeral"},
+            },
+        ]
+
+    def _system_blocks(self) -> list:
+        """Return the block list rendered when DNA was loaded."""
+        return self._system_block_list
+
     def ask_about_trait(self, question: str) -> str:
         """
         Ask the agent about a health trait.
@@ -125,30 +248,51 @@ When answering about health traits, ALWAYS:
         Returns:
             Personalized analysis relating their DNA to the trait
         """
+        return "".join(self.stream_trait_answer(question))
+
+    def stream_trait_answer(self, question: str):
+        """
+        Stream the personalized trait analysis as it is generated.
+
+        Args:
+            question: User's question about a health trait
+
+        Yields:
+            Text chunks of the analysis as they arrive
+        """
         self.conversation_history.append({
             "role": "user",
             "content": question
         })
 
-        response = self.client.messages.create(
+        parts = []
+        with self.client.messages.stream(
             model=self.model,
             max_tokens=2000,
-            system=self._build_system_prompt(),
-            messages=self.conversation_history
-        )
-
-        answer = response.content[0].text
+            system=self._system_blocks(),
+            messages=with_summary(self.conversation_history, self.rolling_summary)
+        ) as stream:
+            for text in stream.text_stream:
+                parts.append(text)
+                yield text
 
         self.conversation_history.append({
             "role": "assistant",
-            "content": answer
+            "content": "".join(parts)
         })
 
-        return answer
+        self._trim_history()
+
+    def _trim_history(self):
+        """Bound history to the sliding window, summarizing dropped turns."""
+        self.conversation_history, self.rolling_summary = trim_history(
+            self.client, self.conversation_history, self.rolling_summary
+        )
 
     def reset_conversation(self):
         """Start a new conversation."""
         self.conversation_history = []
+        self.rolling_summary = ""
 
 
 def main():
@@ -206,18 +350,21 @@ def main():
         if question.lower() == 'variants':
             print("\n📋 Your Health Variants:")
             print("-"*70)
-            for rsid, info in agent.health_snps_db.items():
-                if rsid in agent.user_snps:
-                    genotype = agent.user_snps[rsid]
-                    print(f"  {rsid:15} | {info.get('gene'):12} | {genotype:5} | {info.get('trait')}")
+            for rsid in SORTED_RSIDS:
+                genotype = agent.user_snps.get(rsid)
+                if genotype is None:
+                    continue
+                info = agent.health_snps_db[rsid]
+                print(f"  {rsid:15} | {info.get('gene'):12} | {_decode_genotype(genotype):5} | {info.get('trait')}")
             print()
             continue
 
-        # Ask agent about the trait
+        # Ask agent about the trait (streamed as it generates)
         print("\nAgent: ", end="", flush=True)
         try:
-            response = agent.ask_about_trait(question)
-            print(response)
+            for chunk in agent.stream_trait_answer(question):
+                print(chunk, end="", flush=True)
+            print()
         except Exception as e:
             print(f"\n❌ Error: {str(e)}")
             print("Please try again.\n")
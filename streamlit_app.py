@@ -8,20 +8,102 @@ Users can:
 3. Access their DNA data with: ?dna_guid={GUID}
 """
 
+import hashlib
+import os
+
 import streamlit as st
 from pathlib import Path
-from dotenv import load_dotenv
+from env_loader import ensure_env
 from health_trait_agent import HealthTraitAgent
 from dna_storage import DNAStorage
 
 # Load environment variables
-env_path = Path(__file__).parent / ".env"
-if env_path.exists():
-    load_dotenv(env_path)
+ensure_env()
 
 # Initialize storage
 storage = DNAStorage()
 
+
+@st.cache_resource(show_spinner=False)
+def _load_snps(key, _upload, path):
+    """
+    Parse a DNA file once per (content/mtime) key.
+
+    Cached across reruns and sessions, so widget interactions and
+    repeated loads of the same file skip the multi-second parse. Only
+    the parsed genotype dict is cached - the agent carries per-session
+    conversation state and must never be shared between sessions, so
+    each session constructs its own from this dict (cheap: one pass
+    over the tracked rsids).
+
+    Args:
+        key: Cache key (content hash for uploads, path:mtime for paths)
+        _upload: Uploaded file object (excluded from hashing), else None
+        path: Filesystem path for path loads, else None
+
+    Returns:
+        Full {rsid: genotype} dict
+    """
+    from dna_cache import load_user_snps
+
+    if _upload is not None:
+        import shutil
+        import tempfile
+        # Stream to disk in 1 MiB chunks - never one whole-file bytes
+        # object for a 20-50 MB upload
+        _upload.seek(0)
+        with tempfile.NamedTemporaryFile(delete=False, suffix=".txt") as tmp:
+            shutil.copyfileobj(_upload, tmp, length=1024 * 1024)
+            tmp_path = tmp.name
+        return load_user_snps(tmp_path)
+    return load_user_snps(path)
+
+@st.cache_resource(show_spinner=False)
+def _get_prs():
+    """
+    Shared PolygenicriskCalculator for the server process.
+
+    Building the calculator packs the fused weight matrix; the warmup
+    call exercises the scoring path once so every session after server
+    boot hits a warm instance instead of rebuilding per rerun.
+
+    Returns:
+        The process-wide PolygenicriskCalculator
+    """
+    from polygenic_risk import PolygenicriskCalculator
+    calc = PolygenicriskCalculator()
+    calc.calculate_prs({"rs7903146": "CT"}, "type_2_diabetes")
+    return calc
+
+
+@st.cache_data(show_spinner=False)
+def _variant_rows(key, _agent):
+    """
+    Build the sidebar variant table rows once per loaded genome.
+
+    The cache is process-global, so the key must identify the genome
+    itself (upload content hash, path:mtime, or storage GUID) - a
+    weaker key like SNP count would serve one user's genotypes to
+    another whose file happens to match it.
+
+    Args:
+        key: Genome identity key from the load path
+        _agent: The loaded HealthTraitAgent (excluded from hashing)
+
+    Returns:
+        List of row dicts for st.dataframe
+    """
+    return [
+        {
+            "rsID": rsid,
+            "Gene": _agent.health_snps_db[rsid].get("gene", "?"),
+            "Genotype": _agent.genotype_of(rsid),
+            "Trait": _agent.health_snps_db[rsid].get("trait", "?"),
+        }
+        for rsid in sorted(_agent.user_snps)
+    ]
+
+
 # Page configuration
 st.set_page_config(
     page_title="DNA Health Trait Analyzer",
@@ -52,6 +134,11 @@ st.markdown("""
     </style>
 """, unsafe_allow_html=True)
 
+# Trigger the PRS warmup: cache_resource only executes on first call,
+# so without this the calculator would be built lazily by whichever
+# session needs it first instead of once at server startup
+_get_prs()
+
 # Initialize session state
 if "agent" not in st.session_state:
     st.session_state.agent = None
@@ -60,6 +147,7 @@ if "agent" not in st.session_state:
     st.session_state.health_variants_found = 0
     st.session_state.dna_guid = None
     st.session_state.show_guid_link = False
+    st.session_state.dna_key = None
 
 # Check URL for GUID parameter
 query_params = st.query_params
@@ -71,18 +159,15 @@ if "dna_guid" in query_params and not st.session_state.dna_loaded:
             if user_snps:
                 # Create agent and load stored DNA
                 agent = HealthTraitAgent()
-                agent.user_snps = user_snps
+                agent.set_user_snps(user_snps)
                 st.session_state.agent = agent
                 st.session_state.dna_loaded = True
                 st.session_state.user_snps_count = len(user_snps)
                 st.session_state.dna_guid = dna_guid
+                st.session_state.dna_key = dna_guid
 
-                # Count health variants
-                health_variants = sum(
-                    1 for rsid in agent.health_snps_db.keys()
-                    if rsid in user_snps
-                )
-                st.session_state.health_variants_found = health_variants
+                # agent.user_snps is already the tracked intersection
+                st.session_state.health_variants_found = len(agent.user_snps)
 
                 st.success(f"✓ Loaded {len(user_snps):,} SNPs from your profile")
             else:
@@ -128,35 +213,39 @@ with st.sidebar:
         else:
             with st.spinner("Loading and parsing your DNA (this may take a minute)..."):
                 try:
-                    agent = HealthTraitAgent()
-
-                    # Handle uploaded file or file path
+                    # Handle uploaded file or file path (cached per file)
                     if hasattr(dna_file, 'read'):
-                        # It's an uploaded file - save temporarily
-                        import tempfile
-                        with tempfile.NamedTemporaryFile(delete=False, suffix=".txt") as tmp:
-                            tmp.write(dna_file.read())
-                            tmp_path = tmp.name
-                        success = agent.load_dna(tmp_path)
+                        # Hash in chunks so the key never needs the
+                        # whole file materialized either
+                        hasher = hashlib.blake2b(digest_size=16)
+                        for chunk in iter(lambda: dna_file.read(1024 * 1024), b""):
+                            hasher.update(chunk)
+                        dna_file.seek(0)
+                        key = hasher.hexdigest()
+                        user_snps = _load_snps(key, dna_file, None)
                     else:
-                        # It's a file path
-                        success = agent.load_dna(dna_file)
+                        key = f"{dna_file}:{os.path.getmtime(dna_file)}"
+                        user_snps = _load_snps(key, None, dna_file)
+
+                    # Per-session agent over the shared parsed dict:
+                    # conversation state stays inside this session
+                    agent = HealthTraitAgent()
+                    agent.set_user_snps(user_snps)
+                    success = agent.total_snps > 0
 
                     if success:
                         st.session_state.agent = agent
                         st.session_state.dna_loaded = True
-                        st.session_state.user_snps_count = len(agent.user_snps)
+                        st.session_state.user_snps_count = agent.total_snps
+                        st.session_state.dna_key = key
 
-                        # Count health variants
-                        health_variants = sum(
-                            1 for rsid in agent.health_snps_db.keys()
-                            if rsid in agent.user_snps
-                        )
+                        # agent.user_snps is already the tracked intersection
+                        health_variants = len(agent.user_snps)
                         st.session_state.health_variants_found = health_variants
 
                         # Try to save to persistent storage (Supabase)
                         if storage.is_available():
-                            guid = storage.save_dna(agent.user_snps, agent.health_snps_db)
+                            guid = storage.save_dna(user_snps, agent.health_snps_db)
                             if guid:
                                 st.session_state.dna_guid = guid
                                 st.session_state.show_guid_link = True
@@ -196,20 +285,16 @@ with st.sidebar:
             st.markdown("**Your Health Variants**")
             agent = st.session_state.agent
 
-            variant_data = []
-            for rsid, info in sorted(agent.health_snps_db.items()):
-                if rsid in agent.user_snps:
-                    variant_data.append({
-                        "rsID": rsid,
-                        "Gene": info.get("gene", "?"),
-                        "Genotype": agent.user_snps[rsid],
-                        "Trait": info.get("trait", "?")
-                    })
-
+            variant_data = _variant_rows(
+                st.session_state.dna_key, agent
+            )
             if variant_data:
-                for v in variant_data:
-                    st.caption(f"**{v['rsID']}** ({v['Gene']}) {v['Genotype']}")
-                    st.caption(f"_{v['Trait']}_")
+                # One dataframe element instead of 2N captions per rerun
+                st.dataframe(
+                    variant_data,
+                    use_container_width=True,
+                    hide_index=True,
+                )
 
         st.markdown("---")
 
@@ -274,20 +359,21 @@ else:
         with st.chat_message("user"):
             st.write(question)
 
-        # Get agent response
+        # Stream the agent response as it is generated - first tokens
+        # render after TTFT instead of after the full 2000-token answer
         with st.chat_message("assistant"):
-            with st.spinner("Analyzing your DNA..."):
-                try:
-                    response = st.session_state.agent.ask_about_trait(question)
-                    st.write(response)
-
-                    # Add assistant response to history
-                    st.session_state.conversation.append({
-                        "role": "assistant",
-                        "content": response
-                    })
-                except Exception as e:
-                    st.error(f"Error: {str(e)}")
+            try:
+                response = st.write_stream(
+                    st.session_state.agent.stream_trait_answer(question)
+                )
+
+                # Add assistant response to history
+                st.session_state.conversation.append({
+                    "role": "assistant",
+                    "content": response
+                })
+            except Exception as e:
+                st.error(f"Error: {str(e)}")
 
     # Help section
     with st.expander("ℹ️ How to use this tool"):
@@ -10,11 +10,9 @@ from dna_parser import DNAParser
 from variant_annotator import VariantAnnotator
 from llm_interpreter import DNAInterpreter, MEDICAL_DISCLAIMER
 
-# Load environment
-from dotenv import load_dotenv
-env_path = Path(__file__).parent / ".env"
-if env_path.exists():
-    load_dotenv(env_path)
+# Load environment (memoized - parses .env at most once per process)
+from env_loader import ensure_env
+ensure_env()
 
 
 def main():
@@ -33,8 +31,8 @@ def main():
         return
 
     parser = DNAParser(dna_file)
-    snps = parser.parse()
-    user_snps = {snp.rsid: snp.genotype for snp in snps}
+    user_snps = parser.parse_genotypes()
+    print(f"✓ Parsed {len(user_snps):,} SNPs from {Path(dna_file).name}")
 
     # Step 2: Find health variants
     print("\nSTEP 2: Analyzing health variants...")
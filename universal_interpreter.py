@@ -3,16 +3,15 @@ Universal DNA interpreter - answer questions about ANY genetic variant or trait.
 Uses Claude to research and explain genetics dynamically.
 """
 
+import hashlib
 import json
+import re
 from typing import Dict, Optional
 from pathlib import Path
-from dotenv import load_dotenv
-from anthropic import Anthropic
-
-# Load environment
-env_path = Path(__file__).parent / ".env"
-if env_path.exists():
-    load_dotenv(env_path)
+from api_client import get_client
+from llm_cache import LLMResponseCache
+from conversation import trim_history, with_summary
+from health_snps import get_health_snps_list
 
 SYSTEM_PROMPT = """You are an expert genetics educator and DNA analyst. Your role is to answer questions about:
 - Specific genetic variants (SNPs) and their effects
@@ -57,14 +56,69 @@ When asked about a trait or condition:
 5. Discuss preventable vs non-preventable aspects
 """
 
+# rsIDs mentioned in a question are found with one C-level regex pass
+# over the question, then probed against the SNP dict - instead of a
+# substring scan over all ~900K dict keys per ask
+_RSID_RE = re.compile(r'rs\d+', re.IGNORECASE)
+
+
 class UniversalDNAInterpreter:
     """Answer questions about any aspect of genetics and DNA."""
 
     def __init__(self):
         """Initialize the interpreter."""
-        self.client = Anthropic()
+        self.client = get_client()
         self.conversation_history = []
+        self.rolling_summary = ""
         self.user_snps = {}  # Store user's SNP data if provided
+        self._system_text = SYSTEM_PROMPT
+        self._response_cache = self._build_response_cache()
+
+    def set_health_variants(self, health_variants: Dict[str, Dict]):
+        """
+        Append the user's health-variant table to the system prompt.
+
+        The combined prefix is static within a session, so Anthropic's
+        prompt caching can reuse it: after the first call, subsequent
+        questions pay ~10% of the prefix's input-token cost.
+
+        Args:
+            health_variants: Dict of rsid -> variant info from user's DNA
+        """
+        variant_table = "\n\nUSER'S HEALTH VARIANTS:\n"
+        for rsid, data in sorted(health_variants.items()):
+            variant_table += (
+                f"- {rsid} ({data.get('gene')}): {data.get('genotype')}"
+                f" - {data.get('trait')}\n"
+            )
+
+        self._system_text = SYSTEM_PROMPT + variant_table
+        self._response_cache = self._build_response_cache()
+
+    def _system_blocks(self):
+        """System prompt as a block list with a prompt-cache marker."""
+        return [{
+            "type": "text",
+            "text": self._system_text,
+            "cache_control": {"type": "ephemeral"},
+        }]
+
+    def _build_response_cache(self) -> LLMResponseCache:
+        """Build the response cache, keyed to the current SNP profile."""
+        # Profile key covers the tracked health rsids - enough to keep
+        # cached answers from leaking between different genomes without
+        # hashing the full ~900k-entry dict
+        profile = "|".join(
+            f"{rsid}:{self.user_snps.get(rsid, '')}"
+            for rsid in get_health_snps_list()
+        )
+        return LLMResponseCache(
+            model="claude-haiku-4-5-20251001",
+            system_prompt=self._system_text,
+            profile_key=hashlib.sha256(
+                f"{len(self.user_snps)}|{profile}".encode()
+            ).hexdigest(),
+        )
 
     def set_user_snps(self, snps: Dict[str, str]):
         """
@@ -74,6 +128,7 @@ class UniversalDNAInterpreter:
             snps: Dictionary of rsid -> genotype from user's DNA
         """
         self.user_snps = snps
+        self._response_cache = self._build_response_cache()
         print(f"✓ Loaded {len(snps):,} of your SNPs for personalized analysis")
 
     def ask(self, question: str) -> str:
@@ -86,36 +141,73 @@ class UniversalDNAInterpreter:
         Returns:
             Expert explanation from Claude
         """
+        return "".join(self.ask_stream(question))
+
+    def ask_stream(self, question: str):
+        """
+        Ask a question, streaming the answer as it is generated.
+
+        First text arrives after time-to-first-token instead of after
+        the full generation, so interactive callers (Streamlit's
+        st.write_stream, the CLI loop) can render incrementally.
+
+        Args:
+            question: User's question about DNA/genetics
+
+        Yields:
+            Text chunks of the answer as they arrive
+        """
         # Add context about user's SNPs if asking about specific variants
         full_question = question
 
-        # Check if question is about a specific variant and we have that data
-        for rsid in self.user_snps.keys():
-            if rsid.lower() in question.lower():
-                genotype = self.user_snps[rsid]
+        # Extract rsIDs from the question and probe the SNP dict, rather
+        # than substring-scanning every key against the question
+        for match in _RSID_RE.finditer(question):
+            rsid = match.group(0).lower()
+            genotype = self.user_snps.get(rsid)
+            if genotype is not None:
                 full_question += f"\n\n[User's genotype at {rsid}: {genotype}]"
                 break
 
+        # Serve repeated questions from the cache - no API round-trip.
+        # Cache keys carry no conversation context, so only a question
+        # asked at the start of a conversation is safe to cache or
+        # replay; mid-conversation follow-ups may refer back to earlier
+        # answers and must always hit the API.
+        cacheable = not self.conversation_history and not self.rolling_summary
+        cached = self._response_cache.get(full_question) if cacheable else None
+        if cached is not None:
+            self.conversation_history.append({"role": "user", "content": full_question})
+            self.conversation_history.append({"role": "assistant", "content": cached})
+            yield cached
+            return
+
         self.conversation_history.append({
             "role": "user",
             "content": full_question
         })
 
-        response = self.client.messages.create(
+        parts = []
+        with self.client.messages.stream(
             model="claude-haiku-4-5-20251001",
             max_tokens=2000,
-            system=SYSTEM_PROMPT,
-            messages=self.conversation_history
-        )
-
-        answer = response.content[0].text
-
+            system=self._system_blocks(),
+            messages=with_summary(self.conversation_history, self.rolling_summary)
+        ) as stream:
+            for text in stream.text_stream:
+                parts.append(text)
+                yield text
+
+        # Append to history only once the stream has completed
+        answer = "".join(parts)
         self.conversation_history.append({
             "role": "assistant",
             "content": answer
         })
 
-        return answer
+        if cacheable:
+            self._response_cache.put(full_question, answer)
+        self._trim_history()
 
     def lookup_variant(self, rsid: str) -> str:
         """
@@ -211,9 +303,13 @@ Explain:
             Personalized genetic summary and recommendations
         """
         # Format variants for Claude
-        variants_text = "Your genetic variants:\n"
-        for rsid, data in health_variants.items():
-            variants_text += f"- {rsid} ({data.get('gene')}): {data.get('genotype')} - {data.get('trait')}\n"
+        # Linear-time join instead of quadratic += concatenation
+        parts = ["Your genetic variants:\n"]
+        parts.extend(
+            f"- {rsid} ({data.get('gene')}): {data.get('genotype')} - {data.get('trait')}\n"
+            for rsid, data in health_variants.items()
+        )
+        variants_text = "".join(parts)
 
         question = f"""{variants_text}
 
@@ -227,9 +323,16 @@ Based on my genetics, provide:
 
         return self.ask(question)
 
+    def _trim_history(self):
+        """Bound history to the sliding window, summarizing dropped turns."""
+        self.conversation_history, self.rolling_summary = trim_history(
+            self.client, self.conversation_history, self.rolling_summary
+        )
+
     def reset_conversation(self):
         """Reset conversation history for new topic."""
         self.conversation_history = []
+        self.rolling_summary = ""
 
 
 if __name__ == "__main__":
@@ -3,12 +3,22 @@ Annotate genetic variants using public APIs and databases.
 Integrates with MyVariant.info for comprehensive variant information.
 """
 
+import os
 import requests
 import json
-import time
+import shelve
+from requests.adapters import HTTPAdapter, Retry
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Dict, List, Optional
 from health_snps import get_health_snp, HEALTH_SNPS
 
+# Disk cache for remote annotations; override location with DNA_ANNOT_CACHE
+_ANNOT_CACHE_PATH = os.environ.get(
+    "DNA_ANNOT_CACHE",
+    str(Path.home() / ".cache" / "dna-analysis" / "annotations"),
+)
+
 
 class VariantAnnotator:
     """Annotate variants using MyVariant.info API."""
@@ -18,6 +28,56 @@ class VariantAnnotator:
         self.api_url = "https://myvariant.info/v1"
         self.cache = {}
         self.rate_limit_delay = 0.1  # seconds between requests
+        self._tracked = frozenset(HEALTH_SNPS.keys())
+        # One pooled session: TCP/TLS handshakes are reused across calls,
+        # and transient failures are retried with backoff at the
+        # transport layer instead of hand-rolled sleep loops
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=50,
+            max_retries=Retry(
+                total=5,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=["GET", "POST"],
+            ),
+        ))
+        self._disk = None  # shelve handle, opened lazily on first use
+
+    def _disk_cache(self):
+        """Open the persistent annotation cache, or None if unavailable."""
+        if self._disk is None:
+            try:
+                Path(_ANNOT_CACHE_PATH).parent.mkdir(parents=True, exist_ok=True)
+                self._disk = shelve.open(_ANNOT_CACHE_PATH)
+            except OSError as e:
+                print(f"Warning: could not open annotation cache: {str(e)}")
+                self._disk = False
+        # An empty shelf is falsy, so compare against the sentinel
+        return None if self._disk is False else self._disk
+
+    def _cache_get(self, rsid: str) -> Optional[Dict]:
+        """Look up a remote annotation: memory first, then disk."""
+        hit = self.cache.get(rsid)
+        if hit is not None:
+            return hit
+        disk = self._disk_cache()
+        if disk is not None:
+            hit = disk.get(rsid)
+            if hit is not None:
+                self.cache[rsid] = hit  # promote for this process
+        return hit
+
+    def _cache_put(self, rsid: str, hit: Dict) -> None:
+        """Store a remote annotation in memory and on disk."""
+        self.cache[rsid] = hit
+        disk = self._disk_cache()
+        if disk is not None:
+            try:
+                disk[rsid] = hit
+            except OSError as e:
+                print(f"Warning: could not write annotation cache: {str(e)}")
 
     def annotate_snp(self, rsid: str) -> Dict:
         """
@@ -61,10 +121,121 @@ class VariantAnnotator:
         Returns:
             Dict mapping rsid -> annotation data
         """
+        # annotate_snp only consults the in-process database, so there
+        # is nothing to rate-limit here; rate_limit_delay applies only
+        # to paths that actually issue HTTP requests
+        return {rsid: self.annotate_snp(rsid) for rsid in rsids}
+
+    def annotate_batch_remote(self, rsids: List[str],
+                              batch_size: int = 500) -> Dict[str, Dict]:
+        """
+        Annotate rsids against MyVariant.info in bulk POST batches.
+
+        One POST per ~500 rsids instead of one GET per rsid, so network
+        latency is paid per batch rather than per variant. Responses are
+        cached on the instance; 429 responses back off and retry once.
+
+        Args:
+            rsids: List of SNP identifiers
+            batch_size: rsids per POST (MyVariant accepts up to 1000)
+
+        Returns:
+            Dict mapping rsid -> raw MyVariant annotation (rsids the
+            service doesn't know are omitted)
+        """
+        results = {}
+        pending = []
+        for rsid in rsids:
+            hit = self._cache_get(rsid)
+            if hit is not None:
+                results[rsid] = hit
+            else:
+                pending.append(rsid)
+
+        for start in range(0, len(pending), batch_size):
+            batch = pending[start:start + batch_size]
+            try:
+                # Rate-limit and server errors are retried with backoff
+                # by the session's transport adapter
+                response = self.session.post(
+                    f"{self.api_url}/variant",
+                    data={
+                        "ids": ",".join(batch),
+                        "fields": "clinvar,dbsnp,cadd",
+                    },
+                    timeout=30,
+                )
+                response.raise_for_status()
+
+                for hit in response.json():
+                    rsid = hit.get("query")
+                    if not rsid or hit.get("notfound"):
+                        continue
+                    self._cache_put(rsid, hit)
+                    results[rsid] = hit
+            except (requests.RequestException, ValueError) as e:
+                print(f"Warning: MyVariant batch failed ({str(e)})")
+
+        return results
+
+    def _fetch_one(self, rsid: str, fields: str) -> Optional[Dict]:
+        """
+        Fetch one rsid from the per-variant endpoint. Transient errors
+        (429/5xx) are retried with exponential backoff by the session's
+        transport adapter. Returns None on failure or not-found.
+        """
+        try:
+            response = self.session.get(
+                f"{self.api_url}/variant/{rsid}",
+                params={"fields": fields},
+                timeout=30,
+            )
+            if response.status_code == 404:
+                return None
+            response.raise_for_status()
+            return response.json()
+        except (requests.RequestException, ValueError) as e:
+            print(f"Warning: MyVariant fetch failed for {rsid} ({str(e)})")
+            return None
+
+    def annotate_batch_concurrent(self, rsids: List[str],
+                                  fields: str = "clinvar,dbsnp,cadd",
+                                  max_workers: int = 20) -> Dict[str, Dict]:
+        """
+        Annotate rsids via the per-variant endpoint, requests in flight
+        concurrently.
+
+        For fields the bulk POST endpoint doesn't expose, this overlaps
+        the round-trip latency of up to max_workers requests instead of
+        paying RTT serially per rsid. The workload is pure I/O wait, so
+        threads over the pooled session are the right tool here.
+
+        Args:
+            rsids: List of SNP identifiers
+            fields: MyVariant fields selector
+            max_workers: Maximum concurrent requests
+
+        Returns:
+            Dict mapping rsid -> raw MyVariant annotation (failures and
+            unknown rsids are omitted)
+        """
         results = {}
+        pending = []
         for rsid in rsids:
-            results[rsid] = self.annotate_snp(rsid)
-            time.sleep(self.rate_limit_delay)
+            hit = self._cache_get(rsid)
+            if hit is not None:
+                results[rsid] = hit
+            else:
+                pending.append(rsid)
+
+        if pending:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                for rsid, hit in zip(
+                    pending, pool.map(lambda r: self._fetch_one(r, fields), pending)
+                ):
+                    if hit is not None:
+                        self._cache_put(rsid, hit)
+                        results[rsid] = hit
 
         return results
 
@@ -80,20 +251,21 @@ class VariantAnnotator:
         """
         health_variants = {}
 
-        # Check each health SNP
-        for health_rsid in HEALTH_SNPS.keys():
-            if health_rsid in user_snps:
-                genotype = user_snps[health_rsid]
-                health_info = get_health_snp(health_rsid)
-
-                health_variants[health_rsid] = {
-                    "rsid": health_rsid,
-                    "genotype": genotype,
-                    "gene": health_info.get("gene"),
-                    "trait": health_info.get("trait"),
-                    "description": health_info.get("description"),
-                    "alleles": health_info.get("alleles"),
-                }
+        # Single set intersection instead of probing the user dict per
+        # SNP; index the database dict directly rather than paying a
+        # function call (and a fresh dict build) per hit
+        health_db = HEALTH_SNPS
+        for health_rsid in self._tracked.intersection(user_snps):
+            health_info = health_db[health_rsid]
+
+            health_variants[health_rsid] = {
+                "rsid": health_rsid,
+                "genotype": user_snps[health_rsid],
+                "gene": health_info.get("gene"),
+                "trait": health_info.get("trait"),
+                "description": health_info.get("description"),
+                "alleles": health_info.get("alleles"),
+            }
 
         return health_variants
 